@@ -1,5 +1,9 @@
+import time
 import streamlit as st
 
+# 스크립트 실행 시작 시각 (첫 화면 렌더링 시간 측정용)
+APP_STARTED = time.perf_counter()
+
 
 # set_page_config는 반드시 첫 번째 Streamlit 명령이어야 함
 st.set_page_config(
@@ -13,17 +17,20 @@ st.set_page_config(
 from streamlit_option_menu import option_menu
 import warnings
 
+import pandas as pd
+
 # 경고 메시지 무시
 warnings.filterwarnings("ignore")
 
-# 페이지 모듈 임포트
-from ui.home import run_home
-from ui.description import run_description
-from ui.eda_kia import run_eda_kia
-from ui.eda_hyundai import run_eda_hyundai
-from ui.trend import run_trend
-from ui.prediction_region import run_prediction_region
-from ui.ho import run_ho
+# 데이터 카탈로그가 세션마다 테이블을 깊은 복사하지 않고 얕은 복사로 나눠줄 수 있도록
+# 앱 전체에서 pandas Copy-on-Write 사용 (pandas 3 부터는 기본값)
+if int(pd.__version__.split('.')[0]) < 3:
+    pd.set_option('mode.copy_on_write', True)
+
+# 페이지 모듈은 ui.pages 레지스트리에서 처음 선택될 때 임포트
+from ui.pages import PAGES, import_times, load_page
+from ui.catalog import get_catalog
+from ui.news_prefetch import start_news_prefetcher
 
 def configure_page():
     """스트림릿 페이지 기본 설정"""
@@ -54,24 +61,9 @@ def main_menu():
         
         return option_menu(
             menu_title=None,
-    options=[
-        "홈",              # 0
-        "지역별 예측",      # 1
-        "기후별 예측",      # 2
-        "기아 분석",        # 3
-        "현대 분석",        # 4
-        "시장 트렌드",      # 5
-        "프로젝트 개발과정", # 6
-    ],
-    icons=[
-        "house",           # 홈
-        "geo-alt",         # 지역별 예측 (지도/지역)
-        "cloud-sun",       # 기후별 예측 (날씨)
-        "truck-front-fill",# 기아 분석 (자동차)
-        "car-front",       # 현대 분석 (차량 중심)
-        "graph-up-arrow",  # 시장 트렌드 (그래프)
-        "tools",           # 프로젝트 개발과정 (공구/도구)
-    ],
+            # 메뉴 항목과 아이콘은 페이지 레지스트리(ui.pages.PAGES)에서 가져옴
+            options=list(PAGES),
+            icons=[icon for _, _, icon in PAGES.values()],
             default_index=0,
             styles={
                 "container": {"padding": "0!important"},
@@ -80,26 +72,23 @@ def main_menu():
         )
 
 def route_pages(selected_page):
-    """페이지 라우팅 처리"""
-    page_functions = {
-        "홈": run_home,
-        "기아 분석": run_eda_kia,
-        "현대 분석": run_eda_hyundai,
-        "시장 트렌드": run_trend,
-        "지역별 예측": run_prediction_region,
-        "기후별 예측": run_ho,
-        "프로젝트 개발과정": run_description,
-    }
-    
-    if selected_page in page_functions:
-        page_functions[selected_page]()
+    """페이지 라우팅 처리 (선택된 페이지 모듈만 임포트)"""
+    if selected_page in PAGES:
+        load_page(selected_page)()
     else:
         st.warning("페이지를 찾을 수 없습니다")
 
 # 데이터 로딩 캐싱 설정
 @st.cache_data(ttl=3600)
 def load_all_data():
-    # 모든 데이터 로딩 함수 통합
+    # 모든 데이터 로딩 함수 통합: 카탈로그에 테이블과 롱 포맷 뷰를 미리 적재
+    catalog = get_catalog().load_all()
+    usage = catalog.memory_usage()
+    print(f"[catalog] {len(usage)}개 데이터셋, {usage['메모리(MB)'].sum():.2f}MB")
+    # 예측 모델은 미리 적재하지 않음: 페이지는 사전 계산된 예측 테이블을 읽고,
+    # 모델은 예측 테이블을 다시 만들어야 할 때(forecast_store.build_forecasts)만 풀에서 읽음
+    # 뉴스는 주기적으로 미리 받아 공용 캐시에 저장
+    start_news_prefetcher()
     return True
 
 def main():
@@ -109,5 +98,11 @@ def main():
     selected_page = main_menu()
     route_pages(selected_page)
 
+    # 세션의 첫 화면 렌더링 시간 기록 (페이지 모듈 임포트 시간 포함)
+    if "startup_time" not in st.session_state:
+        st.session_state.startup_time = time.perf_counter() - APP_STARTED
+        print(f"[startup] 첫 화면({selected_page}) {st.session_state.startup_time:.2f}s, "
+              f"임포트된 페이지 {len(import_times)}개")
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,7 +1,7 @@
 import os
+import sys
 import streamlit as st
 import pandas as pd
-import pickle
 import plotly.graph_objects as go
 import requests
 from prophet import Prophet
@@ -9,6 +9,10 @@ from prophet import Prophet
 # OpenAI 클라이언트 초기화
 from openai import OpenAI
 
+# 저장소 루트의 공통 모듈(ui.model_pool)을 함께 사용
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..')))
+from ui.model_pool import load_pickle_model
+
 
 client = OpenAI(api_key=st.secrets["OPENAI_API_KEY"])
 def load_model(selected_market, model_dir):
@@ -18,9 +22,8 @@ def load_model(selected_market, model_dir):
     if not os.path.exists(model_path):
         st.error("❌ 해당 시장의 모델 파일이 존재하지 않습니다.")
         return None
-    with open(model_path, "rb") as f:
-        model = pickle.load(f)
-    return model
+    # 프로세스 공용 모델 풀에서 가져옴 (처음 한 번만 unpickle)
+    return load_pickle_model(model_path)
 
 def load_sales_data(csv_path, selected_market):
     """CSV 파일에서 해당 시장의 실제 수출 실적 데이터를 불러오기."""
@@ -5,6 +5,11 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from streamlit_option_menu import option_menu
 import os
+import sys
+
+# 저장소 루트의 공통 모듈(ui.long_format)을 함께 사용
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from ui.long_format import melt_monthly
 
 
 
@@ -182,41 +187,10 @@ def run_eda_기아():
         df_domestic = df_filtered[df_filtered['거래 유형'] == '국내']
         df_international = df_filtered[df_filtered['거래 유형'] != '국내']
 
-        # 연도 및 월 컬럼 추가
-        years = df_sales['연도'].unique()
-        months = ['1월', '2월', '3월', '4월', '5월', '6월', '7월', '8월', '9월', '10월', '11월', '12월']
-        month_mapping = {month: idx + 1 for idx, month in enumerate(months)}
-
-        # 데이터프레임 생성 함수
-        def create_melted_dataframe(df):
-            df_melted = pd.DataFrame()
-            for year in years:
-                year_data = df[df['연도'] == year]
-                for month in months:
-                    if month in year_data.columns:
-                        temp_df = year_data[['차종', month]].copy()
-                        temp_df.rename(columns={month: '판매량'}, inplace=True)
-                        temp_df['연도'] = year
-                        temp_df['월'] = month
-                        df_melted = pd.concat([df_melted, temp_df], ignore_index=True)
-
-            # "월" 컬럼을 숫자로 변환
-            df_melted['월'] = df_melted['월'].map(month_mapping)
-
-            # "연도-월"을 datetime 객체로 변환
-            df_melted['연도-월'] = pd.to_datetime(df_melted['연도'].astype(str) + '-' + df_melted['월'].astype(str), format='%Y-%m')
-
-            # 2023년 1월부터 2025년 3월까지만 필터링
-            df_melted = df_melted[(df_melted['연도-월'] >= pd.to_datetime('2023-01-01')) & (df_melted['연도-월'] <= pd.to_datetime('2025-03-01'))]
-
-            # 데이터 확인 코드 추가 (디버깅용, 필요에 따라 주석 처리)
-            # st.write("df_melted:", df_melted.head())
-
-            return df_melted
 
         # 국내와 해외 데이터프레임 생성
-        df_melted_domestic = create_melted_dataframe(df_domestic)
-        df_melted_international = create_melted_dataframe(df_international)
+        df_melted_domestic = melt_monthly(df_domestic, '차종', start='2023-01-01', end='2025-03-01')
+        df_melted_international = melt_monthly(df_international, '차종', start='2023-01-01', end='2025-03-01')
 
         # 그래프 그리기
         fig_domestic = px.line(df_melted_domestic, x='연도-월', y='판매량', color='차종',
@@ -5,6 +5,11 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from streamlit_option_menu import option_menu
 import os
+import sys
+
+# 저장소 루트의 공통 모듈(ui.long_format)을 함께 사용
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from ui.long_format import melt_monthly
 
 # CSS 스타일링 (이전 스타일 코드 그대로 사용)
 st.markdown("""
@@ -414,32 +419,9 @@ def run_eda_hyundai():
             df_domestic = df_filtered[df_filtered['판매 구분'] == '내수용']
             df_international = df_filtered[df_filtered['판매 구분'] != '내수용']
 
-            # 월별 데이터 변환 (수정된 함수)
-            months = ['1월', '2월', '3월', '4월', '5월', '6월', '7월', '8월', '9월', '10월', '11월', '12월']
-            month_mapping = {month: idx + 1 for idx, month in enumerate(months)}
-
-            def create_melted_dataframe(df, max_date):
-                df_melted = pd.DataFrame()
-                for year in df['연도'].unique():
-                    year_data = df[df['연도'] == year]
-                    for month in months:
-                        if month in year_data.columns:
-                            temp_df = year_data[['차량 모델', month]].copy()
-                            temp_df.rename(columns={month: '판매량'}, inplace=True)
-                            temp_df['연도'] = year
-                            temp_df['월'] = month
-                            df_melted = pd.concat([df_melted, temp_df], ignore_index=True)
-                
-                df_melted['월'] = df_melted['월'].map(month_mapping)
-                df_melted['연도-월'] = pd.to_datetime(
-                    df_melted['연도'].astype(str) + '-' + df_melted['월'].astype(str), 
-                    format='%Y-%m'
-                )
-                df_melted = df_melted[df_melted['연도-월'] <= max_date]  # 핵심 수정 부분
-                return df_melted
 
-            df_melted_domestic = create_melted_dataframe(df_domestic, max_date)
-            df_melted_international = create_melted_dataframe(df_international, max_date)
+            df_melted_domestic = melt_monthly(df_domestic, '차량 모델', end=max_date)
+            df_melted_international = melt_monthly(df_international, '차량 모델', end=max_date)
 
             # 그래프 생성
             if df_melted_domestic.empty and df_melted_international.empty:
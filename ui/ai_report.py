@@ -0,0 +1,85 @@
+import hashlib
+import os
+import streamlit as st
+from ui.data_store import BASE_DIR
+
+REPORT_MODEL = "gpt-4-0125-preview"
+SYSTEM_PROMPT = "당신은 자동차 수출 시장 전문 보고서를 작성하는 전문가입니다."
+REPORT_CACHE_DIR = os.path.join(BASE_DIR, ".cache", "reports")
+
+
+@st.cache_resource(show_spinner=False)
+def get_openai_client():
+    """OpenAI 클라이언트 (OPENAI_BASE_URL 환경 변수로 로컬 스텁 서버를 지정할 수 있음)"""
+    from openai import OpenAI
+
+    try:
+        api_key = st.secrets["OPENAI_API_KEY"]
+    except (KeyError, OSError):
+        raise RuntimeError("OPENAI_API_KEY 가 secrets 에 설정되지 않았습니다.") from None
+    return OpenAI(api_key=api_key, base_url=os.environ.get("OPENAI_BASE_URL"))
+
+
+def report_key(prompt, model=REPORT_MODEL):
+    """모델, 시스템 프롬프트, 사용자 프롬프트(브랜드·시장·분기·예측치·뉴스 제목 포함)의 해시"""
+    content = "\n".join([model, SYSTEM_PROMPT, prompt])
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _report_path(key):
+    return os.path.join(REPORT_CACHE_DIR, f"{key}.md")
+
+
+def read_cached_report(prompt):
+    """같은 프롬프트로 완성된 보고서가 있으면 반환"""
+    try:
+        with open(_report_path(report_key(prompt)), encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def save_report(prompt, text):
+    try:
+        os.makedirs(REPORT_CACHE_DIR, exist_ok=True)
+        path = _report_path(report_key(prompt))
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(path + ".tmp", path)
+    except OSError:
+        pass
+
+
+def generate_report(prompt, client=None, job=None):
+    """백그라운드 작업용: 보고서를 받아오면서 job.partial 에 지금까지 받은 내용을 기록"""
+    text = ""
+    for delta in stream_report(prompt, client=client):
+        text += delta
+        if job is not None:
+            job.partial = text
+            job.update(message=f"AI 분석 보고서 작성 중... ({len(text):,}자)")
+    return text.strip()
+
+
+def stream_report(prompt, client=None, model=REPORT_MODEL):
+    """보고서를 토큰 단위로 yield 하고, 끝까지 받으면 디스크 캐시에 저장"""
+    client = client or get_openai_client()
+    stream = client.chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ],
+        stream=True
+    )
+    chunks = []
+    for chunk in stream:
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if delta:
+            chunks.append(delta)
+            yield delta
+    text = "".join(chunks).strip()
+    if text:
+        save_report(prompt, text)
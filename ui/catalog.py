@@ -0,0 +1,143 @@
+import threading
+import pandas as pd
+import streamlit as st
+from ui.data_store import MONTH_COLUMNS, TABLES, decode_categories, read_table, source_version
+
+
+def copy_on_write():
+    """pandas Copy-on-Write 가 켜져 있는지 (pandas 3 부터는 항상 켜져 있음)"""
+    if int(pd.__version__.split('.')[0]) >= 3:
+        return True
+    return pd.get_option('mode.copy_on_write') is True
+
+
+def _share(df):
+    """보관 중인 데이터프레임을 호출한 쪽에 넘길 복사본
+
+    Copy-on-Write 가 켜져 있으면 얕은 복사만으로 원본이 보호되고,
+    꺼져 있으면(앱 밖 CLI 등) 깊은 복사로 넘겨 페이지의 수정이 원본에 닿지 않게 합니다.
+    """
+    return df.copy(deep=not copy_on_write())
+
+
+def _add_total(column):
+    def build(df):
+        df[column] = df[MONTH_COLUMNS].sum(axis=1)
+        return df
+    return build
+
+
+def _kia_export(df):
+    df['연간합계'] = df[MONTH_COLUMNS].sum(axis=1)
+    df['차량유형'] = df['차량 구분'].str.split('(').str[0]
+    return df
+
+
+# 원본 테이블에 붙이는 파생 컬럼 (페이지마다 따로 계산하던 합계 컬럼)
+TABLE_BUILDERS = {
+    "기아_지역별수출실적_전처리": _kia_export,
+    "기아_차종별판매실적": _add_total('연간합계'),
+    "기아_해외공장판매실적_전처리": _add_total('연간합계'),
+    "기아_해외현지판매_전처리": _add_total('월별합계'),
+}
+
+# 롱 포맷 뷰: 뷰 이름 -> (원본 테이블, id 컬럼, 값 컬럼명)
+VIEWS = {
+    "기아_수출_long": ("기아_지역별수출실적_전처리", ['차량유형', '국가명', '연도'], '수출량'),
+    "기아_판매_long": ("기아_차종별판매실적", ['차종', '차량 구분', '거래 유형', '연도'], '판매량'),
+    "기아_공장_long": ("기아_해외공장판매실적_전처리", ['공장명(국가)', '공장 코드', '차종', '연도'], '판매량'),
+    "기아_현지판매_long": ("기아_해외현지판매_전처리", ['국가명', '공장명(국가)', '차종', '연도'], '판매량'),
+}
+
+
+def melt_months(df, id_vars, value_name):
+    """월 컬럼(1월~12월)을 '월'(정수) 컬럼으로 녹이는 공통 변환"""
+    melted = df.melt(id_vars=id_vars, value_vars=MONTH_COLUMNS,
+                     var_name='월', value_name=value_name)
+    melted['월'] = melted['월'].str[:-1].astype('int8')
+    return melted
+
+
+class DatasetCatalog:
+    """프로세스 전체에서 데이터셋과 파생 뷰를 보관하는 카탈로그
+
+    조회할 때마다 원본 CSV 의 버전(수정 시각, 크기)을 확인해서, 바뀐 테이블과
+    그 테이블에서 만든 뷰만 다시 읽습니다.
+    """
+
+    def __init__(self):
+        self._tables = {}
+        self._views = {}
+        self._versions = {}
+        self._view_versions = {}
+        self._lock = threading.Lock()
+
+    def _load(self, name):
+        """최신 버전의 원본 테이블 (원본 CSV 가 바뀌었으면 다시 읽음)"""
+        version = source_version(name)
+        if self._versions.get(name) != version:
+            with self._lock:
+                if self._versions.get(name) != version:
+                    df = decode_categories(read_table(name))
+                    builder = TABLE_BUILDERS.get(name)
+                    if builder is not None:
+                        df = builder(df)
+                    self._tables[name] = df
+                    self._versions[name] = version
+        return self._tables[name]
+
+    def table(self, name):
+        """원본(파생 컬럼 포함) 테이블의 복사본
+
+        페이지에서 컬럼을 추가하거나 값을 바꿔도 카탈로그의 원본은 바뀌지 않습니다. (_share 참고)
+        """
+        return _share(self._load(name))
+
+    def version(self, name):
+        """테이블의 데이터셋 버전. 원본 CSV 가 바뀌면 다음 조회 때 다시 읽고 값이 달라짐"""
+        self._load(name)
+        return self._versions[name]
+
+    def view(self, name):
+        """롱 포맷 파생 뷰의 복사본 (원본 테이블이 다시 읽히면 뷰도 다시 만듦)"""
+        table_name, id_vars, value_name = VIEWS[name]
+        version = self.version(table_name)
+        if self._view_versions.get(name) != version:
+            melted = melt_months(self.table(table_name), id_vars, value_name)
+            with self._lock:
+                self._views[name] = melted
+                self._view_versions[name] = version
+        return _share(self._views[name])
+
+    def load_all(self):
+        for name in TABLES:
+            self.table(name)
+        for name in VIEWS:
+            self.view(name)
+        return self
+
+    def memory_usage(self):
+        """보관 중인 데이터셋별 행 수와 메모리 사용량"""
+        rows = []
+        for kind, store in (("table", self._tables), ("view", self._views)):
+            for name, df in store.items():
+                rows.append({
+                    "데이터셋": name,
+                    "구분": kind,
+                    "행 수": len(df),
+                    "메모리(MB)": df.memory_usage(deep=True).sum() / 1024 ** 2,
+                })
+        return pd.DataFrame(rows, columns=["데이터셋", "구분", "행 수", "메모리(MB)"])
+
+
+@st.cache_resource(show_spinner=False)
+def get_catalog():
+    return DatasetCatalog()
+
+
+def get_table(name):
+    return get_catalog().table(name)
+
+
+def get_view(name):
+    return get_catalog().view(name)
@@ -0,0 +1,124 @@
+import pandas as pd
+import streamlit as st
+from ui.catalog import get_table
+from ui.long_format import MONTHS
+from ui.vehicle_taxonomy import get_taxonomy
+
+TOTAL = '총합'
+DIMENSIONS = ['데이터', '연도', '월', '국가', '모델', '카테고리', '거래유형']
+TIME_DIMENSIONS = ['연도', '월']
+
+# 브랜드별 원본 테이블과 큐브 차원 매핑
+# (데이터 이름, 테이블, {큐브 차원: 원본 컬럼}, 국내 거래 구분 값, 제외할 행)
+SOURCES = {
+    "현대": [
+        ("판매", "현대_차종별판매실적", {'모델': '차량 모델', '거래유형': '판매 구분'}, '내수용', None),
+        ("수출", "현대_지역별수출실적", {'국가': '국가'}, None, None),
+    ],
+    "기아": [
+        ("판매", "기아_차종별판매실적", {'모델': '차종', '거래유형': '거래 유형'}, '국내', None),
+        ("수출", "기아_지역별수출실적_전처리", {'국가': '국가명', '카테고리': '차량 구분'}, None, ('차량 구분', TOTAL)),
+    ],
+}
+
+
+def _facts(brand):
+    """원본 테이블들을 공통 차원의 long 포맷 사실 테이블로 변환"""
+    frames = []
+    for source, table, columns, domestic, exclude in SOURCES[brand]:
+        df = get_table(table)
+        if exclude is not None:
+            df = df[df[exclude[0]] != exclude[1]]
+        melted = df.melt(id_vars=['연도'] + list(columns.values()), value_vars=MONTHS,
+                         var_name='월', value_name='값')
+        melted = melted.rename(columns={v: k for k, v in columns.items()})
+        melted['데이터'] = source
+        if '모델' in melted.columns and '카테고리' not in melted.columns:
+            melted['카테고리'] = get_taxonomy(brand).lookup(melted['모델'], '카테고리')
+        if domestic is not None:
+            melted['거래유형'] = melted['거래유형'].where(melted['거래유형'] == domestic, '해외').replace(domestic, '국내')
+        frames.append(melted.reindex(columns=DIMENSIONS + ['값']))
+    return pd.concat(frames, ignore_index=True)
+
+
+@st.cache_resource(show_spinner=False)
+def get_cube(brand):
+    """브랜드별 사전 집계 큐브
+
+    연도·월·국가·모델·카테고리·거래유형 단위로 합계를 미리 구하고,
+    연도/월에 대해서는 '총합' 롤업(연간 합계, 전체 기간 누적)을 함께 저장합니다.
+    """
+    facts = _facts(brand)
+    parts = []
+    for roll_year in (False, True):
+        for roll_month in (False, True):
+            part = facts
+            if roll_year or roll_month:
+                part = facts.copy()
+                if roll_year:
+                    part['연도'] = TOTAL
+                if roll_month:
+                    part['월'] = TOTAL
+            parts.append(part.groupby(DIMENSIONS, dropna=False, sort=False)['값'].sum().reset_index())
+    return pd.concat(parts, ignore_index=True)
+
+
+def _order_columns(pivot, columns, sort_columns):
+    if columns == '월':
+        return pivot.reindex(columns=MONTHS, fill_value=0)
+    if sort_columns:
+        ordered = pivot.sum().sort_values(ascending=False).index.tolist()
+    else:
+        ordered = sorted(pivot.columns)
+    return pivot[ordered]
+
+
+def _select(cube, filters, dims):
+    """필터 조건에 맞고 dims 차원이 롤업('총합')이 아닌 큐브 행"""
+    mask = pd.Series(True, index=cube.index)
+    for dim, value in filters.items():
+        if isinstance(value, (list, tuple, set)):
+            mask &= cube[dim].isin(value)
+        else:
+            mask &= cube[dim] == value
+    for dim in dims:
+        mask &= cube[dim].notna() & (cube[dim] != TOTAL)
+    return cube[mask]
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def pivot_slice(_cube, brand, source, index, columns, filters=None, totals=True, total_row=True, sort_columns=False):
+    """큐브에서 pivot 을 잘라냄 (원본 행에 대한 groupby 없이 사전 집계 결과만 사용)
+
+    - filters: {차원: 값 또는 값 목록}. 연도/월을 지정하지 않으면 '총합' 롤업을 사용
+    - totals: '총합' 열(맨 앞)을 붙이고 총합 기준 내림차순 정렬
+    - total_row: totals 와 함께 '총합' 행(맨 위)도 붙임
+    - sort_columns: 열을 열 합계 기준 내림차순으로 정렬 (월/연도 외 차원)
+    """
+    cube = _cube[_cube['데이터'] == source]
+    filters = dict(filters or {})
+    for dim in TIME_DIMENSIONS:
+        if dim not in (index, columns) and dim not in filters:
+            filters[dim] = TOTAL
+
+    sliced = _select(cube, filters, [index, columns])
+    pivot = sliced.groupby([index, columns])['값'].sum().unstack(fill_value=0)
+    pivot = _order_columns(pivot, columns, sort_columns)
+    if not totals:
+        return pivot
+
+    # 총합 열: 연도/월 pivot 은 큐브의 롤업 값을 그대로 사용
+    if columns in TIME_DIMENSIONS:
+        rollup = _select(cube, {**filters, columns: TOTAL}, [index])
+        row_totals = rollup.groupby(index)['값'].sum().reindex(pivot.index, fill_value=0)
+    else:
+        row_totals = pivot.sum(axis=1)
+    pivot.insert(0, TOTAL, row_totals)
+    pivot = pivot.sort_values(by=TOTAL, ascending=False)
+    if not total_row:
+        return pivot
+
+    # 총합 행: 표시되는 행의 합계 (카테고리에 매핑되지 않은 모델은 포함하지 않음)
+    total_row = pivot.sum(numeric_only=True)
+    total_row.name = TOTAL
+    return pd.concat([total_row.to_frame().T, pivot])
@@ -0,0 +1,162 @@
+import functools
+import hashlib
+import os
+import tempfile
+import pandas as pd
+
+# 프로젝트 루트 기준 경로 (페이지 모듈 위치와 상관없이 동일한 경로 사용)
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(BASE_DIR, "data")
+PARQUET_DIR = os.path.join(DATA_DIR, "parquet")
+
+MONTH_COLUMNS = [f"{i}월" for i in range(1, 13)]
+CATEGORY_COLUMNS = ['국가명', '차종', '차량 구분']
+
+# 대시보드에서 사용하는 전처리 완료 테이블 (원본_* 파일은 원본 보기 화면에서만 사용하므로 제외)
+TABLES = {
+    "기아": "기아.csv",
+    "기아_gdp": "기아_gdp.csv",
+    "기아_시장구분별_수출실적": "기아_시장구분별_수출실적.csv",
+    "기아_지역별수출실적_전처리": "기아_지역별수출실적_전처리.csv",
+    "기아_차종별판매실적": "기아_차종별판매실적.csv",
+    "기아_해외공장판매실적_전처리": "기아_해외공장판매실적_전처리.csv",
+    "기아_해외현지판매_전처리": "기아_해외현지판매_전처리.csv",
+    "수출 주요 국가 차량 판매량 순위": "수출 주요 국가 차량 판매량 순위_정리 완료2.csv",
+    "현대_시장구분별_수출실적": "현대_시장구분별_수출실적.csv",
+    "현대_지역별수출실적": "현대_지역별수출실적.csv",
+    "현대_차종별판매실적": "현대_차종별판매실적.csv",
+}
+
+
+def _umask():
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# open() 으로 새로 만든 파일과 같은 권한 (mkstemp 임시 파일은 0600 으로 만들어짐)
+FILE_MODE = 0o666 & ~_umask()
+
+
+def apply_schema(df):
+    """공통 스키마 적용: 범주형 문자열 컬럼, int32 월 컬럼, int16 연도"""
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    month_cols = [col for col in MONTH_COLUMNS if col in df.columns]
+    if month_cols:
+        df[month_cols] = df[month_cols].astype('int32')
+    if '연도' in df.columns:
+        df['연도'] = df['연도'].astype('int16')
+    if '월' in df.columns:
+        df['월'] = df['월'].astype('int8')
+    return df
+
+
+def csv_path(name):
+    return os.path.join(DATA_DIR, TABLES[name])
+
+
+def parquet_path(name):
+    return os.path.join(PARQUET_DIR, f"{name}.parquet")
+
+
+def read_csv_typed(name):
+    """CSV 를 읽어 스키마를 적용 (Parquet 가 없을 때의 대체 경로)"""
+    return apply_schema(pd.read_csv(csv_path(name)))
+
+
+def _is_fresh(name):
+    # Parquet 는 원본 CSV 의 수정 시각을 그대로 달고 저장됨 (write_parquet 의 source_mtime_ns).
+    # "더 최신인지" 가 아니라 "같은지" 로 비교해야 CSV 를 예전 파일로 되돌린 경우도 다시 만듦
+    path = parquet_path(name)
+    return os.path.exists(path) and os.stat(path).st_mtime_ns == os.stat(csv_path(name)).st_mtime_ns
+
+
+def source_version(name):
+    """원본 CSV 의 (수정 시각(ns), 크기). 메모리에 올린 데이터셋의 버전으로 사용"""
+    stat = os.stat(csv_path(name))
+    return stat.st_mtime_ns, stat.st_size
+
+
+@functools.lru_cache(maxsize=64)
+def _file_sha256(path, mtime_ns, size):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_sha256(path):
+    """파일 내용 sha256. (경로, 수정 시각, 크기) 가 그대로면 stat 만 하고 다시 읽지 않음"""
+    stat = os.stat(path)
+    return _file_sha256(path, stat.st_mtime_ns, stat.st_size)
+
+
+def write_parquet(name, df, source_mtime_ns=None):
+    """임시 파일에 쓴 뒤 교체하여 여러 워커가 동시에 빌드해도 깨진 파일이 남지 않도록 함
+
+    source_mtime_ns: 원본 CSV 에서 만든 경우 그 수정 시각 (Parquet 의 수정 시각으로 기록)
+    """
+    os.makedirs(PARQUET_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=PARQUET_DIR, suffix=".parquet.tmp")
+    os.close(fd)
+    try:
+        df.to_parquet(tmp_path, index=False)
+        os.chmod(tmp_path, FILE_MODE)
+        if source_mtime_ns is not None:
+            os.utime(tmp_path, ns=(source_mtime_ns, source_mtime_ns))
+        os.replace(tmp_path, parquet_path(name))
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def build_table(name):
+    """CSV 한 개를 스키마에 맞춰 Parquet 로 변환"""
+    mtime_ns = os.stat(csv_path(name)).st_mtime_ns
+    df = read_csv_typed(name)
+    write_parquet(name, df, mtime_ns)
+    return df
+
+
+def build_all():
+    """data/*.csv 전체를 data/parquet/*.parquet 로 변환하는 빌드 단계"""
+    for name in TABLES:
+        df = build_table(name)
+        print(f"{name}: {len(df):,}행 -> {parquet_path(name)}")
+
+
+def read_table(name):
+    """Parquet 가 최신이면 Parquet 를, 아니면 CSV 를 읽고 가능한 경우 Parquet 를 새로 만듦"""
+    if name not in TABLES:
+        raise KeyError(f"등록되지 않은 데이터셋입니다: {name}")
+    if _is_fresh(name):
+        try:
+            return pd.read_parquet(parquet_path(name))
+        except (ImportError, ValueError, OSError):
+            pass
+    mtime_ns = os.stat(csv_path(name)).st_mtime_ns
+    df = read_csv_typed(name)
+    try:
+        write_parquet(name, df, mtime_ns)
+    except (ImportError, OSError):
+        # pyarrow 가 없거나 쓰기 권한이 없으면 CSV 결과만 사용
+        pass
+    return df
+
+
+def decode_categories(df):
+    """범주형 컬럼을 원래 문자열 타입으로 되돌림
+
+    범주형 컬럼으로 groupby/pivot_table 을 하면 (pandas 2 기본값 observed=False)
+    필터링된 데이터에서도 전체 범주가 0 으로 채워져 나오므로 기존 페이지 코드에는 문자열을 전달
+    """
+    for col in df.select_dtypes('category').columns:
+        df[col] = df[col].astype(df[col].cat.categories.dtype)
+    return df
+
+
+if __name__ == "__main__":
+    build_all()
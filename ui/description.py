@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
 from streamlit_option_menu import option_menu
+from ui.catalog import get_table
 
 def run_description():
     
@@ -122,8 +123,8 @@ def run_description():
 
         st.markdown("""
     ### 📈 데이터 전처리 결과""")
-        df1=pd.read_csv('data/기아_지역별수출실적_전처리.csv')
-        df2=pd.read_csv('data/현대_차종별판매실적.csv')
+        df1=get_table("기아_지역별수출실적_전처리")
+        df2=get_table("현대_차종별판매실적")
         df1_filtered = df1[df1["차량 구분"] != "총합"]
         df1_top5 = df1_filtered.sort_values(by="2월", ascending=False).head(5)
         df2_top5 = df2.sort_values(by="2월", ascending=False).head(5)
@@ -136,8 +137,8 @@ def run_description():
         st.markdown("---")
         st.markdown("""
     ### 📈  지역별 Prophet 예측 + 자동차 시장 트렌드 반영 LLM 분석 모델 제작과정""")
-        df1=pd.read_csv('data/현대_지역별수출실적.csv')
-        df2=pd.read_csv('data/현대_시장구분별_수출실적.csv')
+        df1=get_table("현대_지역별수출실적")
+        df2=get_table("현대_시장구분별_수출실적")
         st.markdown("""
     원본 데이터를 **Prophet 모델**에 적합한 형태로 변환하기 위해
     `pd.melt()` 함수를 활용하여 **시계열 데이터**로 wide → long 변환하였습니다.
@@ -253,7 +254,7 @@ def run_description():
     단순 평균보다 현실적인 방식으로, 데이터 신뢰도와 모델 성능을 동시에 향상시켰습니다.
         """, unsafe_allow_html=True)
             st.markdown("**GDP+기후별 전처리 후 데이터**")
-            df1=pd.read_csv('data/기아_gdp.csv')
+            df1=get_table("기아_gdp")
             st.dataframe(df1.head(),hide_index=True)
 
             st.markdown("""
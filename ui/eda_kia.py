@@ -1,70 +1,39 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from matplotlib import font_manager, rc
-import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import os
-import platform
-
-# 폰트 설정
-plt.rcParams['axes.unicode_minus'] = False
-
-if platform.system() == 'Darwin':
-    rc('font', family='AppleGothic')
-elif platform.system() == 'Windows':
-    path = "c:/Windows/Fonts/malgun.ttf"
-    font_name = font_manager.FontProperties(fname=path).get_name()
-    rc('font', family=font_name)
-else:
-    print('Unknown system... sorry~~~~')
+from ui.catalog import get_catalog, get_table, get_view
+from ui.fonts import setup_matplotlib_fonts
+from ui.long_format import melt_monthly
+from ui.powertrain_share import PowertrainShares
+from ui.vehicle_taxonomy import get_taxonomy
+from ui.cube import get_cube, pivot_slice
+from ui.styled_table import total_table
+from ui.insights import NO_DATA, year_summary
+
+SALES_TABLE = "기아_차종별판매실적"
+FACTORY_TABLE = "기아_해외공장판매실적_전처리"
+OVERSEAS_TABLE = "기아_해외현지판매_전처리"
 
 months = ['1월', '2월', '3월', '4월', '5월', '6월', '7월', '8월', '9월', '10월', '11월', '12월']
 
 
-@st.cache_data(ttl=3600, show_spinner="데이터 로드 중...")
+
 def load_data():
-    months = ['1월', '2월', '3월', '4월', '5월', '6월', '7월', '8월', '9월', '10월', '11월', '12월']
-    # 지역별 수출 데이터
-    BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-    df_export = pd.read_csv(os.path.join(BASE_DIR, "data/기아_지역별수출실적_전처리.csv"))
-    df_export['연간합계'] = df_export[months].sum(axis=1)
-    df_export['차량유형'] = df_export['차량 구분'].str.split('(').str[0]
-    melt_export = df_export.melt(id_vars=['차량유형', '국가명', '연도'],
-                               value_vars=months,
-                               var_name='월',
-                               value_name='수출량')
-    melt_export['월'] = melt_export['월'].str.replace('월', '').astype(int)
-    # 차종별 판매 데이터
-    df_sales = pd.read_csv(os.path.join(BASE_DIR, "data/기아_차종별판매실적.csv"))
-    df_sales['연간합계'] = df_sales[months].sum(axis=1)
-    melt_sales = df_sales.melt(id_vars=['차종', '차량 구분', '거래 유형', '연도'],
-                             value_vars=months,
-                             var_name='월',
-                             value_name='판매량')
-    melt_sales['월'] = melt_sales['월'].str.replace('월', '').astype(int)
-    # 해외공장 판매 데이터
-    df_factory = pd.read_csv(os.path.join(BASE_DIR, "data/기아_해외공장판매실적_전처리.csv"))
-    df_factory['연간합계'] = df_factory[months].sum(axis=1)
-    melt_factory = df_factory.melt(id_vars=['공장명(국가)', '공장 코드', '차종', '연도'],
-                                 value_vars=months,
-                                 var_name='월',
-                                 value_name='판매량')
-    melt_factory['월'] = melt_factory['월'].str.replace('월', '').astype(int)
-    # 해외현지판매 데이터
-    df_overseas = pd.read_csv(os.path.join(BASE_DIR, "data/기아_해외현지판매_전처리.csv"))
-    df_overseas['월별합계'] = df_overseas[months].sum(axis=1)
-    melt_overseas = df_overseas.melt(id_vars=['국가명', '공장명(국가)', '차종', '연도'],
-                                    value_vars=months,
-                                    var_name='월',
-                                    value_name='판매량')
-    melt_overseas['월'] = melt_overseas['월'].str.replace('월', '').astype(int)
-
-    df_export2 = pd.read_csv(os.path.join(BASE_DIR, "data/기아_지역별수출실적_전처리.csv"))
-    df_export2.drop(df_export2.loc[df_export2['차량 구분'] == '총합'].index, inplace=True)
+    # 카탈로그가 테이블과 롱 포맷 뷰를 프로세스당 한 번만 만들어 보관
+    df_export = get_table("기아_지역별수출실적_전처리")
+    melt_export = get_view("기아_수출_long")
+    df_sales = get_table(SALES_TABLE)
+    melt_sales = get_view("기아_판매_long")
+    df_factory = get_table(FACTORY_TABLE)
+    melt_factory = get_view("기아_공장_long")
+    df_overseas = get_table(OVERSEAS_TABLE)
+    melt_overseas = get_view("기아_현지판매_long")
+
+    # 총합 행만 제외
+    df_export2 = df_export.loc[df_export['차량 구분'] != '총합', df_export.columns.drop(['연간합계', '차량유형'])]
 
     return df_export, df_export2, melt_export, df_sales, melt_sales, df_factory, melt_factory, df_overseas, melt_overseas
 
@@ -73,24 +42,31 @@ def load_data():
 def create_plot(_fig):
     return _fig
 
-# 데이터 로드
-df_export, df_export2,  melt_export, df_sales, melt_sales, df_factory, melt_factory, df_overseas, melt_overseas = load_data()
-
-powertrain_types = {
-    '내연기관': ['Bongo', 'K3', 'K5', 'Carnival', 'Seltos', 'Sportage', 'Sorento'],
-    '전기차': ['EV6', 'EV9', 'Niro EV', 'Soul EV', 'EV5'],
-    '하이브리드': ['Niro', 'Sorento Hybrid', 'Sportage Hybrid']
-}
-
-# 파워트레인 유형 결정 함수
+# 파워트레인 유형 결정 함수 (분류 규칙은 ui.vehicle_taxonomy)
 def get_powertrain_type(model):
-    for ptype, models in powertrain_types.items():
-        if any(m in model for m in models):
-            return ptype
-    return '내연기관'  # 기본값
-
-# 데이터 전처리
-df_overseas['파워트레인'] = df_overseas['차종'].apply(get_powertrain_type)
+    return get_taxonomy("기아").get(model, '파워트레인')
+
+@st.cache_resource(show_spinner="기아 데이터를 불러오는 중...")
+def init_page():
+    """페이지 초기화 (프로세스당 한 번): 폰트 설정, 데이터 로드, 해외현지판매 파워트레인 분류 및 비중 행렬"""
+    setup_matplotlib_fonts()
+    df_export, df_export2, melt_export, df_sales, melt_sales, df_factory, melt_factory, df_overseas, melt_overseas = load_data()
+    df_overseas['파워트레인'] = get_taxonomy("기아").lookup(df_overseas['차종'], '파워트레인')
+    powertrain_shares = PowertrainShares(df_overseas)
+    return df_export, df_export2, melt_export, df_sales, melt_sales, df_factory, melt_factory, df_overseas, melt_overseas, powertrain_shares
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def get_trade_ratios(version):
+    """연도×차종별 거래 유형 비중 (0~1). 인덱스 (연도, 차종), 컬럼 거래 유형
+
+    데이터셋 버전(원본 CSV 가 바뀌면 달라짐)마다 한 번만 피벗합니다.
+    st.cache_data 이므로 호출마다 복사본을 받아 캐시된 표는 바뀌지 않습니다.
+    판매 기록이 없는(합계 0) 차종은 NaN 입니다.
+    """
+    sales = get_table(SALES_TABLE).pivot_table(index=['연도', '차종'], columns='거래 유형', values='연간합계',
+                                              aggfunc='sum', fill_value=0)
+    totals = sales.sum(axis=1)
+    return sales.div(totals.where(totals != 0), axis=0)
 
 # 분석 코멘트 생성을 위한 도우미 함수들
 def get_seasonality_pattern(monthly_data):
@@ -121,29 +97,11 @@ def get_improvement_point(model):
     }
     return points.get(model.split()[0], "디자인 리프레시 + 신기술 적용")
 
-def get_best_month(df, year, country):
-    monthly = df[(df['연도']==year) & (df['국가명']==country)][months].sum()
-    return f"{monthly.idxmax().replace('월','')}월 ({monthly.max():,}대)"
-
-def calculate_sales_volatility(df, year, country):
-    # 월별 컬럼 이름이 '1월', '2월' 형식이므로 원본 컬럼명 사용
-    monthly = df[(df['연도']==year) & (df['국가명']==country)][months].sum()
-    return (monthly.std() / monthly.mean()) * 100
 def get_market_share(country):
     # 가상의 시장 점유율 데이터 (실제 구현시 데이터 연결 필요)
     shares = {'U.S.A': 4.2, 'China': 2.8, 'Germany': 3.5, 'India': 5.1}
     return shares.get(country, 3.0)
 
-def get_fastest_growing_country(df, countries, year):
-    growth = {}
-    for country in countries:
-        prev_year = df[df['국가명']==country]['연도'].max() - 1
-        if prev_year in df['연도'].unique():
-            curr = df[(df['국가명']==country) & (df['연도']==year)]['월별합계'].sum()
-            prev = df[(df['국가명']==country) & (df['연도']==prev_year)]['월별합계'].sum()
-            growth[country] = (curr - prev) / prev * 100 if prev != 0 else 0
-    return max(growth, key=growth.get) if growth else "데이터 부족"
-
 def identify_seasonal_pattern(df, countries):
     patterns = []
     for country in countries:
@@ -170,15 +128,13 @@ def get_seasonal_models(df):
             seasonal.append(f"{model}({monthly.idxmax().replace('월','')}월)")
     return ", ".join(seasonal[:3]) if seasonal else "없음"
 
-def get_ev_leader(df):
+def get_ev_leader(shares, year):
     # 전기차 비율이 가장 높은 국가
-    ev_ratio = df.groupby('국가명').apply(lambda x: x[x['파워트레인']=='전기차']['월별합계'].sum() / x['월별합계'].sum())
-    return ev_ratio.idxmax() if not ev_ratio.empty else "데이터 부족"
+    return shares.leader(year, '전기차')
 
-def get_ice_dependent(df):
+def get_ice_dependent(shares, year):
     # 내연기관 의존도가 가장 높은 국가
-    ice_ratio = df.groupby('국가명').apply(lambda x: x[x['파워트레인']=='내연기관']['월별합계'].sum() / x['월별합계'].sum())
-    return ice_ratio.idxmax() if not ice_ratio.empty else "데이터 부족"
+    return shares.leader(year, '내연기관')
 
 def get_country_policy(country):
     # 국가별 정책 방향 (가상 데이터)
@@ -190,12 +146,10 @@ def get_country_policy(country):
     }
     return policies.get(country, '정보 없음')
 
-st.title("🚗 기아 자동차 통합 분석 대시보드 (최적화 버전)")
-
-
-
-
 def run_eda_kia():
+    df_export, df_export2, melt_export, df_sales, melt_sales, df_factory, melt_factory, df_overseas, melt_overseas, powertrain_shares = init_page()
+
+    st.title("🚗 기아 자동차 통합 분석 대시보드 (최적화 버전)")
 
     
     # 세션 상태 초기화
@@ -528,36 +482,12 @@ def run_eda_kia():
 
                 
                 
-                df_export2_melted =  df_export2.melt(id_vars=['차량 구분', '국가명', '연도'], 
-                                        value_vars=["1월", "2월", "3월", "4월", "5월", "6월", "7월", "8월", "9월", "10월", "11월", "12월"] ,
-                                        var_name='월', value_name='판매량')
-            
-                
-                
+                export_cube = get_cube("기아")
+
                 st.subheader("📌 기아 지역별 수출실적 통계 요약")
                 st.write('')
 
-                국가_차종_피벗 = df_export2_melted.pivot_table(
-                        index='국가명',
-                        columns='차량 구분',
-                        values='판매량',
-                        aggfunc='sum',
-                        fill_value=0
-                    )
-                총합 = 국가_차종_피벗.sum(axis=1)
-                국가_차종_피벗.insert(0, '총합', 총합)
-                국가_차종_피벗 = 국가_차종_피벗.sort_values(by='총합', ascending=False)
-
-                # 총합 컬럼 빼고 나머지 차종 컬럼만 선택
-                차종_컬럼 = 국가_차종_피벗.columns.drop('총합')
-                # 차종별 총합 기준으로 열 순서 정렬
-                정렬된_열_순서 = 국가_차종_피벗[차종_컬럼].sum().sort_values(ascending=False).index.tolist()
-                # 총합을 맨 앞으로 두고 열 재정렬
-                열_순서 = ['총합'] + 정렬된_열_순서
-                국가차종피벗 = 국가_차종_피벗[열_순서]
-                총합_행 = 국가차종피벗.sum(numeric_only=True)
-                총합_행.name = '총합'
-                국가차종피벗 = pd.concat([총합_행.to_frame().T, 국가차종피벗])
+                국가차종피벗 = pivot_slice(export_cube, "기아", "수출", '국가', '카테고리', sort_columns=True)
 
                 # 스타일링을 위해 복사본 생성
                 국가_차종_styled = 국가차종피벗.copy()
@@ -579,132 +509,23 @@ def run_eda_kia():
                 with col1:
                     st.write("""##### 📅 국가 연도별 판매량""")
                     
-                    국가_연도별_피벗 = df_export2_melted.pivot_table(index='국가명', columns='연도', values='판매량', aggfunc='sum', fill_value=0)
-                    국가_연도별_피벗.insert(0, '총합', 국가_연도별_피벗.sum(axis=1))
-                    국가_연도별_피벗 = 국가_연도별_피벗.sort_values(by='총합', ascending=False)
-                    총합_행 = 국가_연도별_피벗.sum(numeric_only=True)
-                    총합_행.name = '총합'
-                    국가연도별피벗 = pd.concat([총합_행.to_frame().T, 국가_연도별_피벗])
-
-                    # --------------------------
-                    # 👉 스타일링 (색상 강조 포함)
-                    # --------------------------
-                    def highlight_total_cells(val, row_idx, col_name):
-                        if row_idx == '총합' or col_name == '총합':
-                            return 'background-color: #d5f5e3'  # 연한 초록색
-                        return ''
-
-                    styled_국가연도별 = 국가연도별피벗.style.format('{:,}').apply(
-                        lambda row: [
-                            highlight_total_cells(val, row.name, col)
-                            for col, val in zip(row.index, row)
-                        ],
-                        axis=1
-                    ).set_properties(**{'text-align': 'center'}).set_table_styles([
-                        {'selector': 'th', 'props': [('text-align', 'center'), ('background-color', '#f8f9f9')]}
-                    ])
-
-                    st.dataframe(styled_국가연도별)
+                    국가연도별피벗 = pivot_slice(export_cube, "기아", "수출", '국가', '연도')
+                    total_table(국가연도별피벗)
                     
                 with col2:
                     st.write("""##### 📆 국가 월별 통계 (2023년~2025년 누적 기준)""")
 
-                    # 월 순서를 올바르게 정의
-                    month_order = ['1월', '2월', '3월', '4월', '5월', '6월', '7월', '8월', '9월', '10월', '11월', '12월']
-
-                    국가_월_피벗 = df_export2_melted.pivot_table(index='국가명', columns='월', values='판매량', aggfunc='sum', fill_value=0)
-                    # 월 순서대로 열 정렬 (총합 열은 아직 없음)
-                    국가_월_피벗 = 국가_월_피벗.reindex(columns=month_order)
-
-                    # 총합 열 추가 (맨 앞에 넣기 위해 insert 사용)
-                    국가_월_피벗.insert(0, '총합', 국가_월_피벗.sum(axis=1))
-                    # 총합 내림차순 정렬
-                    국가_월_피벗 = 국가_월_피벗.sort_values(by='총합', ascending=False)
-                    # 총합 행 추가
-                    총합_행 = 국가_월_피벗.sum(numeric_only=True)
-                    총합_행.name = '총합'
-                    국가월피벗 = pd.concat([총합_행.to_frame().T, 국가_월_피벗])
-
-                    # --------------------------
-                    # 👉 스타일링 (색상 강조 포함)
-                    # --------------------------
-                    def highlight_total_cells(val, row_idx, col_name):
-                        if row_idx == '총합' or col_name == '총합':
-                            return 'background-color: #d5f5e3'  # 연한 초록색
-                        return ''
-
-                    styled_국가월 = 국가월피벗.style.format('{:,}').apply(
-                        lambda row: [
-                            highlight_total_cells(val, row.name, col)
-                            for col, val in zip(row.index, row)
-                        ],
-                        axis=1
-                    ).set_properties(**{'text-align': 'center'}).set_table_styles([
-                        {'selector': 'th', 'props': [('text-align', 'center'), ('background-color', '#f8f9f9')]}
-                    ])
-
-                    st.dataframe(styled_국가월)
+                    국가월피벗 = pivot_slice(export_cube, "기아", "수출", '국가', '월')
+                    total_table(국가월피벗)
 
 
                 st.write("""##### 📆 2023년도 월별 판매량""")
-                국가_2023 = df_export2_melted.loc[df_export2_melted['연도'] == 2023] 
-
-                국가_2023_피벗 = 국가_2023.pivot_table(index='국가명', columns='월', values='판매량', aggfunc='sum', fill_value=0).reindex(columns=month_order)
-                국가_2023_피벗.insert(0, '총합', 국가_2023_피벗.sum(axis=1))
-                국가_2023_피벗 = 국가_2023_피벗.sort_values(by='총합', ascending=False)
-                총합_행 = 국가_2023_피벗.sum(numeric_only=True)
-                총합_행.name = '총합'
-                국가2023피벗 = pd.concat([총합_행.to_frame().T, 국가_2023_피벗])
-
-                # --------------------------
-                # 👉 스타일링 (색상 강조 포함)
-                # --------------------------
-                def highlight_total_cells(val, row_idx, col_name):
-                    if row_idx == '총합' or col_name == '총합':
-                        return 'background-color: #d5f5e3'  # 연한 초록색
-                    return ''
-
-                styled_국가2023 = 국가2023피벗.style.format('{:,}').apply(
-                    lambda row: [
-                        highlight_total_cells(val, row.name, col)
-                        for col, val in zip(row.index, row)
-                    ],
-                    axis=1
-                ).set_properties(**{'text-align': 'center'}).set_table_styles([
-                    {'selector': 'th', 'props': [('text-align', 'center'), ('background-color', '#f8f9f9')]}
-                ])
-
-                st.dataframe(styled_국가2023)
+                국가2023피벗 = pivot_slice(export_cube, "기아", "수출", '국가', '월', {'연도': 2023})
+                total_table(국가2023피벗)
 
                 st.write("""##### 📆 2024년도 월별 판매량""")
-                국가_2024 = df_export2_melted.loc[df_export2_melted['연도'] == 2024] 
-
-                국가_2024_피벗 = 국가_2024.pivot_table(index='국가명', columns='월', values='판매량', aggfunc='sum', fill_value=0).reindex(columns=month_order)
-                국가_2024_피벗.insert(0, '총합', 국가_2024_피벗.sum(axis=1))
-                국가_2024_피벗 = 국가_2024_피벗.sort_values(by='총합', ascending=False)
-                총합_행 = 국가_2024_피벗.sum(numeric_only=True)
-                총합_행.name = '총합'
-                국가2024피벗 = pd.concat([총합_행.to_frame().T, 국가_2024_피벗])
-
-                # --------------------------
-                # 👉 스타일링 (색상 강조 포함)
-                # --------------------------
-                def highlight_total_cells(val, row_idx, col_name):
-                    if row_idx == '총합' or col_name == '총합':
-                        return 'background-color: #d5f5e3'  # 연한 초록색
-                    return ''
-
-                styled_국가2024 = 국가2024피벗.style.format('{:,}').apply(
-                    lambda row: [
-                        highlight_total_cells(val, row.name, col)
-                        for col, val in zip(row.index, row)
-                    ],
-                    axis=1
-                ).set_properties(**{'text-align': 'center'}).set_table_styles([
-                    {'selector': 'th', 'props': [('text-align', 'center'), ('background-color', '#f8f9f9')]}
-                ])
-
-                st.dataframe(styled_국가2024)                
+                국가2024피벗 = pivot_slice(export_cube, "기아", "수출", '국가', '월', {'연도': 2024})
+                total_table(국가2024피벗)
 
                 st.markdown("<div class='tab-content'>", unsafe_allow_html=True)
             
@@ -828,11 +649,10 @@ def run_eda_kia():
             fig2 = get_sales_composition(df_sales, selected_year, top_models)
             st.plotly_chart(fig2, use_container_width=True)
             
-            avg_export_ratio = df_sales[df_sales['연도']==selected_year].groupby('차종')['연간합계'].sum().nlargest(10).index.to_series().apply(
-                lambda x: df_sales[(df_sales['차종']==x) & (df_sales['연도']==selected_year)].groupby('거래 유형')['연간합계'].sum().get('수출', 0)/df_sales[(df_sales['차종']==x) & (df_sales['연도']==selected_year)]['연간합계'].sum()
-            ).mean()*100
+            top_ratios = get_trade_ratios(get_catalog().version(SALES_TABLE)).loc[selected_year].reindex(top_models)
+            avg_export_ratio = top_ratios['수출'].mean()*100
             
-            domestic_models = [m for m in top_models if df_sales[(df_sales['차종']==m) & (df_sales['연도']==selected_year)].groupby('거래 유형')['연간합계'].sum().get('국내', 0)/df_sales[(df_sales['차종']==m) & (df_sales['연도']==selected_year)]['연간합계'].sum() > 0.5]
+            domestic_models = top_ratios.index[top_ratios['국내'] > 0.5].tolist()
             
             st.info(f"""
             **🌐 판매 채널 분석:**
@@ -1012,12 +832,7 @@ def run_eda_kia():
 
         with sub_tab3:
 
-            car_types = {
-                '세단': ['Morning', 'Ray', 'K3', 'K5', 'Stinger', 'K7 / K8', 'K9', "Morning / Picanto", "K5 / Optima", 'K7 / K8 / Cadenza'],
-                'SUV': ['Seltos', 'Niro', 'Sportage', 'Sorento', 'Mohave', 'EV6', 'EV9', "Mohave / Borrego"],
-                '기타': ['Bongo', 'Carnival', 'Bus', "Carnival / Sedona", "Millitary", "Bongo (특수)", "Bus (특수)"]
-            }
-
+            car_types = get_taxonomy("기아").categories
             selected_type = st.selectbox('차종 카테고리 선택', list(car_types.keys()))
 
             df_filtered = df_sales[df_sales['차종'].isin(car_types[selected_type])]
@@ -1027,37 +842,11 @@ def run_eda_kia():
             df_international = df_filtered[df_filtered['거래 유형'] != '국내']
 
             # 연도 및 월 컬럼 추가
-            years = df_sales['연도'].unique()
             months = ['1월', '2월', '3월', '4월', '5월', '6월', '7월', '8월', '9월', '10월', '11월', '12월']
-            month_mapping = {month: idx + 1 for idx, month in enumerate(months)}
-
-            # 데이터프레임 생성 함수
-            def create_melted_dataframe(df):
-                df_melted = pd.DataFrame()
-                for year in years:
-                    year_data = df[df['연도'] == year]
-                    for month in months:
-                        if month in year_data.columns:
-                            temp_df = year_data[['차종', month]].copy()
-                            temp_df.rename(columns={month: '판매량'}, inplace=True)
-                            temp_df['연도'] = year
-                            temp_df['월'] = month
-                            df_melted = pd.concat([df_melted, temp_df], ignore_index=True)
-
-                # "월" 컬럼을 숫자로 변환
-                df_melted['월'] = df_melted['월'].map(month_mapping)
-
-                # "연도-월"을 datetime 객체로 변환
-                df_melted['연도-월'] = pd.to_datetime(df_melted['연도'].astype(str) + '-' + df_melted['월'].astype(str), format='%Y-%m')
-
-                # 2023년 1월부터 2025년 3월까지만 필터링
-                df_melted = df_melted[(df_melted['연도-월'] >= pd.to_datetime('2023-01-01')) & (df_melted['연도-월'] <= pd.to_datetime('2025-03-01'))]
-
-                return df_melted
 
             # 국내와 해외 데이터프레임 생성
-            df_melted_domestic = create_melted_dataframe(df_domestic)
-            df_melted_international = create_melted_dataframe(df_international)
+            df_melted_domestic = melt_monthly(df_domestic, '차종', start='2023-01-01', end='2025-03-01')
+            df_melted_international = melt_monthly(df_international, '차종', start='2023-01-01', end='2025-03-01')
 
             # 그래프 그리기
             fig_domestic = px.line(df_melted_domestic, x='연도-월', y='판매량', color='차종',
@@ -1161,43 +950,12 @@ def run_eda_kia():
 
             # 기아 차종별 판매실적 분석 요약표 작업
         
-            df_sales_melted =  df_sales.melt(id_vars=['차종', '차량 구분', '거래 유형', '연도'], 
-                                    value_vars=["1월", "2월", "3월", "4월", "5월", "6월", "7월", "8월", "9월", "10월", "11월", "12월"] ,
-                                    var_name='월', value_name='판매량')
-
-            # 카테고리 매핑 딕셔너리 만들기
-            car_category_map = {}
-            for category, models in car_types.items():
-                for model in models:
-                    car_category_map[model] = category
-
-            # df_sales에 카테고리 컬럼 추가
-            df_sales_melted['카테고리'] = df_sales_melted['차종'].map(car_category_map)
-            
+            sales_cube = get_cube("기아")
+
             st.divider()
             st.subheader("📊 기아 차종별 판매실적 통계 요약")
             
-            차종_연도_피벗 = df_sales_melted.pivot_table(
-                    index='카테고리',
-                    columns='연도',
-                    values='판매량',
-                    aggfunc='sum',
-                    fill_value=0
-                )
-            총합 = 차종_연도_피벗.sum(axis=1)
-            차종_연도_피벗.insert(0, '총합', 총합)
-            차종_연도_피벗 = 차종_연도_피벗.sort_values(by='총합', ascending=False)
-            
-            # 총합 컬럼 빼고 나머지 차종 컬럼만 선택
-            카테고리_컬럼 = 차종_연도_피벗.columns.drop('총합')
-            # 차종별 총합 기준으로 열 순서 정렬
-            정렬된_열_순서 = 차종_연도_피벗[카테고리_컬럼].sum().sort_values(ascending=False).index.tolist()
-            # 총합을 맨 앞으로 두고 열 재정렬
-            열_순서 = ['총합'] + 정렬된_열_순서
-            차종연도피벗 = 차종_연도_피벗[열_순서]
-            총합_행 = 차종연도피벗.sum(numeric_only=True)
-            총합_행.name = '총합'
-            차종연도피벗 = pd.concat([총합_행.to_frame().T, 차종연도피벗])
+            차종연도피벗 = pivot_slice(sales_cube, "기아", "판매", '카테고리', '연도', sort_columns=True)
 
             # 스타일링을 위해 복사본 생성
             차종_연도_styled = 차종연도피벗.copy()
@@ -1214,8 +972,6 @@ def run_eda_kia():
             st.dataframe(styled_차종_연도, use_container_width=True)
             
 
-            국내 = df_sales_melted.loc[df_sales_melted['거래 유형'] == '국내']
-            해외 = df_sales_melted.loc[df_sales_melted['거래 유형'] != '국내']
 
             st.write('')
             st.write("""##### 🚙 카테고리별 차종 판매량 (연도 기준) """)
@@ -1224,24 +980,24 @@ def run_eda_kia():
             # 국내 카테고리별 차종 판매량
             with col1: 
            
-                국내_세단 = 국내.loc[국내['카테고리'] == '세단']
-                국내_세단_피벗 = 국내_세단.pivot_table(index='차종', columns='연도', values='판매량', aggfunc='sum', fill_value=0)
+                국내_세단_피벗 = pivot_slice(sales_cube, "기아", "판매", '모델', '연도',
+                                           {'거래유형': '국내', '카테고리': '세단'}, totals=False)
                 
                 st.markdown("<h5 style='text-align:center;'>세단</h5>", unsafe_allow_html=True)
                 st.dataframe(국내_세단_피벗)
 
             with col2:
 
-                국내_SUV = 국내.loc[국내['카테고리'] == 'SUV']
-                국내_SUV_피벗 = 국내_SUV.pivot_table(index='차종', columns='연도', values='판매량', aggfunc='sum', fill_value=0)
+                국내_SUV_피벗 = pivot_slice(sales_cube, "기아", "판매", '모델', '연도',
+                                           {'거래유형': '국내', '카테고리': 'SUV'}, totals=False)
 
                 st.markdown("<h5 style='text-align:center;'>SUV</h5>", unsafe_allow_html=True)
                 st.dataframe(국내_SUV_피벗)    
 
             with col3:
 
-                국내_기타 = 국내.loc[국내['카테고리'] == '기타']
-                국내_기타_피벗 = 국내_기타.pivot_table(index='차종', columns='연도', values='판매량', aggfunc='sum', fill_value=0)
+                국내_기타_피벗 = pivot_slice(sales_cube, "기아", "판매", '모델', '연도',
+                                           {'거래유형': '국내', '카테고리': '기타'}, totals=False)
 
                 st.markdown("<h5 style='text-align:center;'>기타</h5>", unsafe_allow_html=True)
                 st.dataframe(국내_기타_피벗)
@@ -1251,24 +1007,24 @@ def run_eda_kia():
             # 해외 카테고리 차종별 판매량
             with col1: 
                 
-                해외_세단 = 해외.loc[해외['카테고리'] == '세단']
-                해외_세단_피벗 = 해외_세단.pivot_table(index='차종', columns='연도', values='판매량', aggfunc='sum', fill_value=0)
+                해외_세단_피벗 = pivot_slice(sales_cube, "기아", "판매", '모델', '연도',
+                                           {'거래유형': '해외', '카테고리': '세단'}, totals=False)
                 
                 st.markdown("<h5 style='text-align:center;'>세단</h5>", unsafe_allow_html=True)
                 st.dataframe(해외_세단_피벗)
 
             with col2:
 
-                해외_SUV = 해외.loc[해외['카테고리'] == 'SUV']
-                해외_SUV_피벗 = 해외_SUV.pivot_table(index='차종', columns='연도', values='판매량', aggfunc='sum', fill_value=0)
+                해외_SUV_피벗 = pivot_slice(sales_cube, "기아", "판매", '모델', '연도',
+                                           {'거래유형': '해외', '카테고리': 'SUV'}, totals=False)
 
                 st.markdown("<h5 style='text-align:center;'>SUV</h5>", unsafe_allow_html=True)
                 st.dataframe(해외_SUV_피벗)    
 
             with col3:
 
-                해외_기타 = 해외.loc[해외['카테고리'] == '기타']
-                해외_기타_피벗 = 해외_기타.pivot_table(index='차종', columns='연도', values='판매량', aggfunc='sum', fill_value=0)
+                해외_기타_피벗 = pivot_slice(sales_cube, "기아", "판매", '모델', '연도',
+                                           {'거래유형': '해외', '카테고리': '기타'}, totals=False)
 
                 st.markdown("<h5 style='text-align:center;'>기타</h5>", unsafe_allow_html=True)
                 st.dataframe(해외_기타_피벗)
@@ -1328,13 +1084,13 @@ def run_eda_kia():
             st.plotly_chart(fig1, use_container_width=True)
 
             
-            top_factory = df_factory[df_factory['연도']==selected_year_factory].groupby('공장명(국가)')['연간합계'].sum().idxmax()
-            top_factory_share = df_factory[df_factory['연도']==selected_year_factory].groupby('공장명(국가)')['연간합계'].sum().max()/df_factory[df_factory['연도']==selected_year_factory]['연간합계'].sum()*100
+            factory_summary = year_summary(FACTORY_TABLE, selected_year_factory, '공장명(국가)', '연간합계')
+            top_factory = factory_summary.top
             
             st.info(f"""
             **🏭 공장별 생산 현황 분석 ({selected_year_factory}년):**
-            - {top_factory} 공장이 전체 생산의 {top_factory_share:.1f}% 차지 (연간 {df_factory[df_factory['연도']==selected_year_factory].groupby('공장명(국가)')['연간합계'].sum().max():,}대)
-            - 신규 공장({df_factory[df_factory['연도']==selected_year_factory].groupby('공장명(국가)')['연간합계'].sum().nsmallest(1).index[0]})은 아직 생산량 낮음 ({df_factory[df_factory['연도']==selected_year_factory].groupby('공장명(국가)')['연간합계'].sum().nsmallest(1).values[0]:,}대)
+            - {top_factory} 공장이 전체 생산의 {factory_summary.share(top_factory):.1f}% 차지 (연간 {factory_summary.top_value:,}대)
+            - 신규 공장({factory_summary.bottom})은 아직 생산량 낮음 ({factory_summary.bottom_value:,}대)
             
             **🌎 글로벌 생산 전략:**
             1. 주력 공장({top_factory}) 최적화:
@@ -1454,14 +1210,14 @@ def run_eda_kia():
             fig3 = get_model_factory(df_factory, selected_year_factory)
             st.plotly_chart(fig3, use_container_width=True)
             
-            most_produced_model = df_factory[df_factory['연도']==selected_year_factory].groupby('차종')['연간합계'].sum().idxmax()
-            model_factories = df_factory[(df_factory['연도']==selected_year_factory) & (df_factory['차종']==most_produced_model)]['공장명(국가)'].nunique()
+            model_summary = year_summary(FACTORY_TABLE, selected_year_factory, '차종', '연간합계', count='공장명(국가)')
+            most_produced_model = model_summary.top
             
             st.info(f"""
             **🚘 차종-공장 매칭 분석:**
-            - 가장 많이 생산되는 모델: {most_produced_model} ({df_factory[df_factory['연도']==selected_year_factory].groupby('차종')['연간합계'].sum().max():,}대)
-            - 다수 공장에서 생산 중인 모델: {most_produced_model} ({model_factories}개 공장)
-            - 단일 공장 전용 모델: {df_factory[df_factory['연도']==selected_year_factory].groupby('차종')['공장명(국가)'].nunique().idxmin()} (1개 공장)
+            - 가장 많이 생산되는 모델: {most_produced_model} ({model_summary.top_value:,}대)
+            - 다수 공장에서 생산 중인 모델: {most_produced_model} ({model_summary.count(most_produced_model)}개 공장)
+            - 단일 공장 전용 모델: {model_summary.fewest_count} (1개 공장)
             
             **🔄 생산 최적화 방안:**
             1. 다각화 생산 시스템:
@@ -1523,14 +1279,16 @@ def run_eda_kia():
             fig4 = get_model_trend(melt_factory, selected_year_factory, selected_model)
             st.plotly_chart(fig4, use_container_width=True)
             
-            model_main_factory = melt_factory[(melt_factory['차종']==selected_model) & (melt_factory['연도']==selected_year_factory)].groupby('공장명(국가)')['판매량'].sum().idxmax()
-            model_volatility = (melt_factory[(melt_factory['차종']==selected_model) & (melt_factory['연도']==selected_year_factory)].groupby('월')['판매량'].sum().std() / melt_factory[(melt_factory['차종']==selected_model) & (melt_factory['연도']==selected_year_factory)].groupby('월')['판매량'].sum().mean()) * 100
+            detail_summary = year_summary(FACTORY_TABLE, selected_year_factory, '공장명(국가)', '연간합계',
+                                          where={'차종': selected_model})
+            model_main_factory = detail_summary.top
+            model_volatility = detail_summary.volatility
             
             st.info(f"""
             **🔎 {selected_model} 생산 현황 심층 분석:**
-            - 주요 생산 공장: {model_main_factory} (점유율 {melt_factory[(melt_factory['차종']==selected_model) & (melt_factory['연도']==selected_year_factory)].groupby('공장명(국가)')['판매량'].sum().max()/melt_factory[(melt_factory['차종']==selected_model) & (melt_factory['연도']==selected_year_factory)]['판매량'].sum()*100:.1f}%)
+            - 주요 생산 공장: {model_main_factory} (점유율 {detail_summary.share(model_main_factory):.1f}%)
             - 생산 변동성: {model_volatility:.1f}% (표준편차 대비 평균)
-            - 최고 생산월: {melt_factory[(melt_factory['차종']==selected_model) & (melt_factory['연도']==selected_year_factory)].groupby('월')['판매량'].sum().idxmax()}월
+            - 최고 생산월: {detail_summary.best_month}월
             
             **📈 개선 전략:**
             1. 생산 균등화:
@@ -1627,15 +1385,15 @@ def run_eda_kia():
             st.plotly_chart(plot_country_monthly(df_overseas, selected_year, selected_country), use_container_width=True)
 
 
-            country_total = df_overseas[(df_overseas['연도']==selected_year) & (df_overseas['국가명']==selected_country)]['월별합계'].sum()
-            country_peak = df_overseas[(df_overseas['연도']==selected_year) & (df_overseas['국가명']==selected_country)][months].sum().idxmax().replace('월','')
-            country_peak_sales = df_overseas[(df_overseas['연도']==selected_year) & (df_overseas['국가명']==selected_country)][months].sum().max()
+            country_summary = year_summary(OVERSEAS_TABLE, selected_year, '국가명', '월별합계')
+            country_total = country_summary.total_of(selected_country)
+            country_peak, country_peak_sales = country_summary.best_month_of(selected_country)
             
             st.info(f"""
             **🇺🇳 {selected_country} 시장 분석 ({selected_year}년):**
             - 총 판매량: {country_total:,}대
             - 최고 판매월: {country_peak}월 ({country_peak_sales:,}대)
-            - 판매 변동성: {calculate_sales_volatility(df_overseas, selected_year, selected_country):.1f}%
+            - 판매 변동성: {country_summary.volatility_of(selected_country):.1f}%
             - 경쟁사 대비 점유율: {get_market_share(selected_country):.1f}%
             
             **🎯 현지화 전략:**
@@ -1691,14 +1449,18 @@ def run_eda_kia():
             if selected_countries:
                 st.plotly_chart(plot_country_comparison(df_overseas, selected_year, selected_countries), use_container_width=True)
 
-                fastest_grower = get_fastest_growing_country(df_overseas, selected_countries, selected_year)
+                fastest_grower = country_summary.fastest_growing(selected_countries)
+                if fastest_grower == NO_DATA:
+                    fastest_growth = "전년 데이터 없음"
+                else:
+                    fastest_growth = f"전년 대비 {country_summary.growth_of(fastest_grower):.1f}% 성장"
                 seasonal_pattern = identify_seasonal_pattern(df_overseas, selected_countries)
                 
                 st.info(f"""
                 **🌐 다국가 비교 분석:**
-                - 가장 빠른 성장국: {fastest_grower} (전년 대비 {df_overseas[(df_overseas['국가명']==fastest_grower) & (df_overseas['연도']==selected_year)]['월별합계'].sum()/df_overseas[(df_overseas['국가명']==fastest_grower) & (df_overseas['연도']==selected_year-1)]['월별합계'].sum()*100-100:.1f}% 성장)
+                - 가장 빠른 성장국: {fastest_grower} ({fastest_growth})
                 - 계절성 패턴: {seasonal_pattern}
-                - 평균 판매 격차: {df_overseas[df_overseas['국가명'].isin(selected_countries) & (df_overseas['연도']==selected_year)].groupby('국가명')['월별합계'].sum().std()/df_overseas[df_overseas['국가명'].isin(selected_countries) & (df_overseas['연도']==selected_year)].groupby('국가명')['월별합계'].sum().mean()*100:.1f}%
+                - 평균 판매 격차: {country_summary.spread(selected_countries):.1f}%
                 
                 **🤝 통합 전략:**
                 1. 공통 마케팅 캠페인:
@@ -1780,7 +1542,7 @@ def run_eda_kia():
 
             year_round_models = get_year_round_models(df_overseas)
             seasonal_models = get_seasonal_models(df_overseas)
-            ev_ratio = df_overseas[(df_overseas['연도']==selected_year) & (df_overseas['파워트레인']=='전기차')]['월별합계'].sum()/df_overseas[df_overseas['연도']==selected_year]['월별합계'].sum()*100
+            ev_ratio = powertrain_shares.global_share(selected_year, '전기차')
             
             st.info(f"""
             **🧐 인기 차종 트렌드 분석:**
@@ -1816,11 +1578,8 @@ def run_eda_kia():
             with col1:
                 # 2-1. 파워트레인 비율 (파이 차트)
                 @st.cache_data(ttl=300)
-                def plot_powertrain_pie(_df, year, country):
-                    powertrain_data = _df[
-                        (_df['연도'] == year) & 
-                        (_df['국가명'] == country)
-                    ].groupby('파워트레인')['월별합계'].sum().reset_index()
+                def plot_powertrain_pie(_shares, year, country):
+                    powertrain_data = _shares.country_year(country, year)
 
                     if powertrain_data.empty:
                         fig = go.Figure()
@@ -1850,15 +1609,13 @@ def run_eda_kia():
                     return fig
 
                 # 출력
-                st.plotly_chart(plot_powertrain_pie(df_overseas, selected_year, selected_power_country), use_container_width=True)
+                st.plotly_chart(plot_powertrain_pie(powertrain_shares, selected_year, selected_power_country), use_container_width=True)
 
             with col2:
                 # 2-2. 파워트레인 연도별 추이 (막대 그래프)
                 @st.cache_data(ttl=300)
-                def plot_powertrain_trend(_df, country):
-                    trend_data = _df[_df['국가명'] == country]\
-                                .groupby(['연도', '파워트레인'])['월별합계'].sum()\
-                                .unstack().fillna(0)
+                def plot_powertrain_trend(_shares, country):
+                    trend_data = _shares.country_trend(country)
 
                     if trend_data.empty:
                         fig = go.Figure()
@@ -1898,12 +1655,13 @@ def run_eda_kia():
                     return fig
 
                 # 출력
-                st.plotly_chart(plot_powertrain_trend(df_overseas, selected_power_country), use_container_width=True)
+                st.plotly_chart(plot_powertrain_trend(powertrain_shares, selected_power_country), use_container_width=True)
 
 
-            ev_share = df_overseas[(df_overseas['국가명']==selected_power_country) & (df_overseas['연도']==selected_year) & (df_overseas['파워트레인']=='전기차')]['월별합계'].sum()/df_overseas[(df_overseas['국가명']==selected_power_country) & (df_overseas['연도']==selected_year)]['월별합계'].sum()*100
-            ice_share = df_overseas[(df_overseas['국가명']==selected_power_country) & (df_overseas['연도']==selected_year) & (df_overseas['파워트레인']=='내연기관')]['월별합계'].sum()/df_overseas[(df_overseas['국가명']==selected_power_country) & (df_overseas['연도']==selected_year)]['월별합계'].sum()*100
-            ev_growth = df_overseas[(df_overseas['국가명']==selected_power_country) & (df_overseas['연도']==selected_year) & (df_overseas['파워트레인']=='전기차')]['월별합계'].sum()/df_overseas[(df_overseas['국가명']==selected_power_country) & (df_overseas['연도']==selected_year-1) & (df_overseas['파워트레인']=='전기차')]['월별합계'].sum()*100-100 if df_overseas[(df_overseas['국가명']==selected_power_country) & (df_overseas['연도']==selected_year-1) & (df_overseas['파워트레인']=='전기차')]['월별합계'].sum() > 0 else 0
+            ev_share = powertrain_shares.share(selected_power_country, selected_year, '전기차')
+            ice_share = powertrain_shares.share(selected_power_country, selected_year, '내연기관')
+            ev_prev = powertrain_shares.sales_of(selected_power_country, selected_year-1, '전기차')
+            ev_growth = powertrain_shares.sales_of(selected_power_country, selected_year, '전기차')/ev_prev*100-100 if ev_prev > 0 else 0
             
             st.info(f"""
             **🔋 {selected_power_country} 파워트레인 전략:**
@@ -1927,17 +1685,9 @@ def run_eda_kia():
             st.subheader("🌐 전 세계 파워트레인 비교 (Top 10 국가)")
             
             @st.cache_data(ttl=300)
-            def plot_global_powertrain(_df, year):
-                # Top 10 국가 추출
-                top_countries = _df[_df['연도'] == year]\
-                    .groupby('국가명')['월별합계'].sum()\
-                    .nlargest(10).index
-
-                # 파워트레인별 집계
-                power_data = _df[
-                    (_df['연도'] == year) & 
-                    (_df['국가명'].isin(top_countries))
-                ].groupby(['국가명', '파워트레인'])['월별합계'].sum().reset_index()
+            def plot_global_powertrain(_shares, year):
+                # Top 10 국가의 파워트레인별 판매량
+                power_data = _shares.top_countries(year, 10)
 
                 # Plotly stacked bar chart
                 fig = px.bar(
@@ -1964,17 +1714,17 @@ def run_eda_kia():
                 return fig
 
             # 출력
-            st.plotly_chart(plot_global_powertrain(df_overseas, selected_year), use_container_width=True)
+            st.plotly_chart(plot_global_powertrain(powertrain_shares, selected_year), use_container_width=True)
 
 
-            ev_leader = get_ev_leader(df_overseas[df_overseas['연도']==selected_year])
-            ice_dependent = get_ice_dependent(df_overseas[df_overseas['연도']==selected_year])
-            avg_ev_ratio = df_overseas[(df_overseas['연도']==selected_year) & (df_overseas['파워트레인']=='전기차')]['월별합계'].sum()/df_overseas[df_overseas['연도']==selected_year]['월별합계'].sum()*100
+            ev_leader = get_ev_leader(powertrain_shares, selected_year)
+            ice_dependent = get_ice_dependent(powertrain_shares, selected_year)
+            avg_ev_ratio = powertrain_shares.global_share(selected_year, '전기차')
             
             st.info(f"""
             **🌍 글로벌 파워트레인 트렌드:**
-            - 전기차 선두국: {ev_leader} (전기차 비율 {df_overseas[(df_overseas['국가명']==ev_leader) & (df_overseas['연도']==selected_year) & (df_overseas['파워트레인']=='전기차')]['월별합계'].sum()/df_overseas[(df_overseas['국가명']==ev_leader) & (df_overseas['연도']==selected_year)]['월별합계'].sum()*100:.1f}%)
-            - 내연기관 의존국: {ice_dependent} (내연기관 비율 {df_overseas[(df_overseas['국가명']==ice_dependent) & (df_overseas['연도']==selected_year) & (df_overseas['파워트레인']=='내연기관')]['월별합계'].sum()/df_overseas[(df_overseas['국가명']==ice_dependent) & (df_overseas['연도']==selected_year)]['월별합계'].sum()*100:.1f}%)
+            - 전기차 선두국: {ev_leader} (전기차 비율 {powertrain_shares.share(ev_leader, selected_year, '전기차'):.1f}%)
+            - 내연기관 의존국: {ice_dependent} (내연기관 비율 {powertrain_shares.share(ice_dependent, selected_year, '내연기관'):.1f}%)
             - 평균 전기차 비율: {avg_ev_ratio:.1f}%
             
             **🚀 지속 가능한 전략:**
@@ -0,0 +1,75 @@
+import functools
+import os
+import platform
+from ui.data_store import BASE_DIR
+
+FONT_DIRS = [os.path.join(BASE_DIR, "custom_fonts"), os.path.join(BASE_DIR, "fonts")]
+FONT_EXTENSIONS = (".ttf", ".otf")
+# 보고서·차트에 사용할 한글 폰트 우선순위
+KOREAN_FAMILIES = ["NanumGothic", "NanumGothicCoding"]
+# 번들 폰트가 없을 때 사용할 운영체제 기본 한글 폰트
+SYSTEM_FONTS = {"Darwin": "AppleGothic", "Windows": "Malgun Gothic"}
+
+
+@functools.lru_cache(maxsize=None)
+def font_files():
+    """custom_fonts/, fonts/ 의 폰트 파일 (파일 이름(확장자 제외) -> 경로). 프로세스당 한 번만 탐색
+
+    같은 이름이 여러 폴더에 있으면 앞 폴더(custom_fonts/)를 사용합니다.
+    """
+    files = {}
+    for font_dir in FONT_DIRS:
+        if not os.path.isdir(font_dir):
+            continue
+        for name in sorted(os.listdir(font_dir)):
+            stem, ext = os.path.splitext(name)
+            if ext.lower() in FONT_EXTENSIONS:
+                files.setdefault(stem, os.path.join(font_dir, name))
+    return files
+
+
+def korean_font():
+    """(일반, 굵게) 한글 폰트 경로. 굵은 폰트가 없으면 일반 폰트를 사용하고, 한글 폰트가 없으면 None"""
+    files = font_files()
+    for family in KOREAN_FAMILIES:
+        if family in files:
+            return files[family], files.get(family + "Bold", files[family])
+    return None
+
+
+def register_pdf_fonts(pdf, family="NanumGothic"):
+    """FPDF 문서에 한글 폰트를 family 이름으로 등록하고 성공하면 True
+
+    폰트 폴더의 원본 파일을 그대로 등록하므로 pyfpdf 는 옆에 있는 .pkl 메트릭을 재사용합니다.
+    (fpdf2 는 .pkl 을 받지 않고 TTF 를 직접 읽습니다)
+    """
+    fonts = korean_font()
+    if fonts is None:
+        return False
+    regular, bold = fonts
+    pdf.add_font(family, "", regular, uni=True)
+    pdf.add_font(family, "B", bold, uni=True)
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def setup_matplotlib_fonts():
+    """matplotlib 에 번들 폰트를 추가하고 한글 폰트를 기본 글꼴로 설정 (프로세스당 한 번)
+
+    fontManager 에 파일만 추가하므로 matplotlib 폰트 캐시를 다시 만들지 않습니다.
+    반환값: 설정한 글꼴 이름 (없으면 None)
+    """
+    from matplotlib import font_manager, rcParams
+
+    rcParams['axes.unicode_minus'] = False
+    for path in font_files().values():
+        font_manager.fontManager.addfont(path)
+
+    fonts = korean_font()
+    if fonts is not None:
+        family = font_manager.FontProperties(fname=fonts[0]).get_name()
+    else:
+        family = SYSTEM_FONTS.get(platform.system())
+    if family:
+        rcParams['font.family'] = family
+    return family
@@ -0,0 +1,148 @@
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+import streamlit as st
+from ui.data_store import BASE_DIR, file_sha256, parquet_path, write_parquet
+from ui.model_pool import load_pickle_model
+
+MODEL_DIR = os.path.join(BASE_DIR, "models")
+FORECAST_TABLE = "prophet_forecasts"
+FORECAST_COLUMNS = ["ds", "yhat", "yhat_lower", "yhat_upper"]
+FORECAST_PERIODS = 18
+
+BRAND_KEYS = {"현대": "hyundai", "기아": "kia"}
+MARKETS = ["북미-미국", "북미-캐나다", "북미-멕시코", "동유럽", "서유럽", "아시아", "중남미", "중동·아프리카"]
+# 화면 표시용 시장 이름 -> 모델 시장 이름
+MARKET_LABEL_MAP = {
+    "미국": "북미-미국", "캐나다": "북미-캐나다", "멕시코": "북미-멕시코",
+    "동유럽": "동유럽", "서유럽": "서유럽", "아시아": "아시아",
+    "중남미": "중남미", "중동·아프리카": "중동·아프리카"
+}
+
+
+def model_path(channel, market):
+    return os.path.join(MODEL_DIR, f"{BRAND_KEYS[channel]}_{market}_model.pkl")
+
+
+def model_paths():
+    """존재하는 전체 브랜드×시장 모델 파일 경로"""
+    paths = [model_path(channel, market) for channel in BRAND_KEYS for market in MARKETS]
+    return [path for path in paths if os.path.exists(path)]
+
+
+def model_hash(path):
+    """모델 파일 내용 해시 (파일이 그대로면 rerun 마다 다시 읽지 않음)"""
+    return file_sha256(path)[:16]
+
+
+def create_forecast(model, periods=FORECAST_PERIODS, freq="ME"):
+    future = model.make_future_dataframe(periods=periods, freq=freq)
+    return model.predict(future)[FORECAST_COLUMNS]
+
+
+def read_forecasts():
+    """저장된 예측 테이블 (없으면 빈 테이블)"""
+    path = parquet_path(FORECAST_TABLE)
+    if os.path.exists(path):
+        try:
+            return pd.read_parquet(path)
+        except (ImportError, ValueError, OSError):
+            pass
+    return pd.DataFrame(columns=["브랜드", "시장", "model_hash"] + FORECAST_COLUMNS)
+
+
+def _forecast_file(path):
+    """프로세스 풀 작업 단위: 모델 파일 하나를 읽어 예측"""
+    with open(path, "rb") as f:
+        return create_forecast(pickle.load(f))
+
+
+def build_forecasts(force=False, max_workers=None):
+    """models/{hyundai,kia}_*_model.pkl 전체를 예측해 하나의 테이블로 저장
+
+    모델 파일 해시가 저장된 값과 같으면 기존 예측을 재사용하고,
+    다시 계산할 모델이 여러 개면 ProcessPoolExecutor 로 코어에 나눠 계산합니다.
+    """
+    stored = read_forecasts()
+    results = {}
+    stale = []
+    for channel in BRAND_KEYS:
+        for market in MARKETS:
+            path = model_path(channel, market)
+            if not os.path.exists(path):
+                continue
+            key = model_hash(path)
+            rows = stored[(stored["브랜드"] == channel) & (stored["시장"] == market) & (stored["model_hash"] == key)]
+            if force or rows.empty:
+                stale.append((channel, market, key, path))
+            results[(channel, market)] = rows
+
+    if len(stale) > 1:
+        workers = min(len(stale), max_workers or os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            forecasts = list(executor.map(_forecast_file, [path for *_, path in stale]))
+    else:
+        forecasts = [create_forecast(load_pickle_model(path)) for *_, path in stale]
+
+    for (channel, market, key, _), rows in zip(stale, forecasts):
+        rows.insert(0, "model_hash", key)
+        rows.insert(0, "시장", market)
+        rows.insert(0, "브랜드", channel)
+        results[(channel, market)] = rows
+        print(f"{channel} {market}: 예측 {len(rows)}행")
+
+    table = pd.concat(results.values(), ignore_index=True)
+    if stale:
+        write_parquet(FORECAST_TABLE, table)
+    return table
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _load_forecast(channel, market, key):
+    stored = read_forecasts()
+    rows = stored[(stored["브랜드"] == channel) & (stored["시장"] == market) & (stored["model_hash"] == key)]
+    if rows.empty:
+        # 모델이 바뀌었거나 예측 테이블이 없으면 테이블을 다시 만듦
+        try:
+            table = build_forecasts()
+        except (ImportError, OSError):
+            table = None
+        if table is not None:
+            rows = table[(table["브랜드"] == channel) & (table["시장"] == market)]
+        else:
+            rows = create_forecast(load_pickle_model(model_path(channel, market)))
+    return rows[FORECAST_COLUMNS].reset_index(drop=True)
+
+
+@st.cache_data(ttl=3600, show_spinner="전체 시장 예측을 불러오는 중...")
+def _load_all_forecasts(keys):
+    table = build_forecasts()
+    return table.drop(columns="model_hash").reset_index(drop=True)
+
+
+def load_all_forecasts():
+    """전체 브랜드×시장 예측 테이블 (브랜드, 시장, ds, yhat, yhat_lower, yhat_upper)"""
+    return _load_all_forecasts(tuple(model_hash(path) for path in model_paths()))
+
+
+def forecast_totals(table, periods=FORECAST_PERIODS):
+    """브랜드×시장별 향후 periods 개월 예측 합계 (시장 × 브랜드 표)"""
+    future = table.sort_values("ds").groupby(["브랜드", "시장"], sort=False).tail(periods)
+    totals = future.pivot_table(index="시장", columns="브랜드", values="yhat", aggfunc="sum")
+    totals = totals.reindex(index=[m for m in MARKETS if m in totals.index],
+                            columns=[b for b in BRAND_KEYS if b in totals.columns])
+    totals["합계"] = totals.sum(axis=1)
+    return totals
+
+
+def load_forecast(channel, market):
+    """브랜드×시장 예측 결과 (ds, yhat, yhat_lower, yhat_upper). 모델 파일이 없으면 None"""
+    path = model_path(channel, market)
+    if not os.path.exists(path):
+        return None
+    return _load_forecast(channel, market, model_hash(path))
+
+
+if __name__ == "__main__":
+    build_forecasts(force=True)
@@ -0,0 +1,94 @@
+import json
+import os
+import time
+import requests
+import streamlit as st
+from ui.catalog import get_table
+from ui.data_store import BASE_DIR
+
+GDP_URL = "http://api.worldbank.org/v2/country/{codes}/indicator/NY.GDP.MKTP.CD"
+GDP_YEAR = 2022
+GDP_TIMEOUT = (2, 5)
+GDP_TTL = 7 * 24 * 3600
+GDP_SNAPSHOT = os.path.join(BASE_DIR, ".cache", "gdp.json")
+
+# 국가명 -> World Bank 국가 코드 (권역 단위 국가명은 코드가 없으므로 CSV 값을 사용)
+COUNTRY_CODES = {
+    '미국': 'USA', '중국': 'CHN', '일본': 'JPN', '독일': 'DEU',
+    '영국': 'GBR', '프랑스': 'FRA', '한국': 'KOR', '인도': 'IND',
+    '브라질': 'BRA', '캐나다': 'CAN', '호주': 'AUS', '이탈리아': 'ITA',
+    '스페인': 'ESP', '멕시코': 'MEX', '인도네시아': 'IDN', '터키': 'TUR',
+    '네덜란드': 'NLD', '스위스': 'CHE', '사우디아라비아': 'SAU', '아르헨티나': 'ARG',
+    'US': 'USA', 'Canada': 'CAN', 'Mexico': 'MEX', 'China': 'CHN', 'India': 'IND',
+}
+
+
+def fetch_bulk(codes, year=GDP_YEAR):
+    """여러 국가 코드의 GDP(10억 달러)를 한 번의 요청으로 가져옴"""
+    url = GDP_URL.format(codes=";".join(sorted(codes)))
+    params = {"format": "json", "date": year, "per_page": 500}
+    response = requests.get(url, params=params, timeout=GDP_TIMEOUT)
+    response.raise_for_status()
+    data = response.json()
+    if len(data) < 2 or not data[1]:
+        return {}
+    return {
+        row['countryiso3code']: row['value'] / 1e9  # 단위: 10억 달러
+        for row in data[1] if row.get('value') is not None
+    }
+
+
+def read_snapshot():
+    try:
+        with open(GDP_SNAPSHOT, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_snapshot(values):
+    try:
+        os.makedirs(os.path.dirname(GDP_SNAPSHOT), exist_ok=True)
+        tmp_path = GDP_SNAPSHOT + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"fetched_at": time.time(), "year": GDP_YEAR, "values": values}, f)
+        os.replace(tmp_path, GDP_SNAPSHOT)
+    except OSError:
+        pass
+
+
+def load_code_gdp():
+    """국가 코드별 GDP: 유효한 디스크 스냅샷 → World Bank 일괄 조회 → 오래된 스냅샷 순으로 사용"""
+    snapshot = read_snapshot()
+    if snapshot and snapshot.get("year") == GDP_YEAR and time.time() - snapshot["fetched_at"] < GDP_TTL:
+        return snapshot["values"]
+    try:
+        values = fetch_bulk(set(COUNTRY_CODES.values()))
+        if values:
+            write_snapshot(values)
+            return values
+    except (requests.exceptions.RequestException, ValueError) as e:
+        print(f"[gdp] World Bank 조회 실패: {e}")
+    return snapshot["values"] if snapshot else {}
+
+
+def fallback_gdp():
+    """CSV 에 들어있는 국가별 GDP (조 달러 → 10억 달러), 최신 연도 기준"""
+    values = {}
+    for name in ("기아", "기아_gdp"):
+        df = get_table(name)
+        latest = df.sort_values('연도').groupby('국가명')['GDP'].last()
+        for country, gdp in latest.items():
+            values.setdefault(country, gdp * 1000)
+    return values
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_gdp_map():
+    """국가명 -> GDP(10억 달러). World Bank 값이 없으면 CSV 값을 사용"""
+    gdp = fallback_gdp()
+    code_gdp = load_code_gdp()
+    for country, code in COUNTRY_CODES.items():
+        if code in code_gdp:
+            gdp[country] = code_gdp[code]
+    return gdp
@@ -1,20 +1,13 @@
 import streamlit as st
 import pandas as pd
-import numpy as np
-import joblib
 import plotly.express as px
 import plotly.graph_objects as go
-from datetime import datetime, timedelta
-import requests
-from PIL import Image
-import yfinance as yf
-import matplotlib.colors as mcolors
-from sklearn.preprocessing import LabelEncoder, StandardScaler
-from lightgbm import LGBMRegressor
-from sklearn.metrics import mean_squared_error, r2_score
+from datetime import datetime
+from ui.gdp_provider import get_gdp_map
+from ui.ho_model import load_artifact, load_export_index, load_long, predict_batch
 
 # CSS 스타일 설정
-st.markdown("""
+PAGE_CSS = """
 <style>
     .main {
         background-color: #f8f9fa;
@@ -63,7 +56,7 @@ st.markdown("""
         box-shadow: 0 2px 4px rgba(0,0,0,0.1);
     }
 </style>
-""", unsafe_allow_html=True)
+"""
 
 # 국가명 매핑 및 유틸리티 함수
 country_kor_map = {
@@ -98,27 +91,6 @@ def get_climate_for_country(country):
     }
     return climate_mapping.get(country, "Unknown")
 
-def fetch_gdp_data(country_name):
-    country_code_map = {
-        '미국': 'USA', '중국': 'CHN', '일본': 'JPN', '독일': 'DEU',
-        '영국': 'GBR', '프랑스': 'FRA', '한국': 'KOR', '인도': 'IND',
-        '브라질': 'BRA', '캐나다': 'CAN', '호주': 'AUS', '이탈리아': 'ITA',
-        '스페인': 'ESP', '멕시코': 'MEX', '인도네시아': 'IDN', '터키': 'TUR',
-        '네덜란드': 'NLD', '스위스': 'CHE', '사우디아라비아': 'SAU', '아르헨티나': 'ARG'
-    }
-    country_code = country_code_map.get(country_name, None)
-    if country_code:
-        try:
-            url = f"http://api.worldbank.org/v2/country/{country_code}/indicator/NY.GDP.MKTP.CD?format=json&date=2022"
-            response = requests.get(url)
-            if response.status_code == 200:
-                data = response.json()
-                if len(data) > 1 and data[1]:
-                    return data[1][0]['value'] / 1e9  # 단위: 10억 달러
-        except:
-            pass
-    return None
-
 def get_change_reason(change_rate):
     if change_rate > 30:
         return {
@@ -186,7 +158,8 @@ def create_tab_buttons():
 def create_gdp_export_scatter(df, selected_country):
     latest_year = df['날짜'].dt.year.max()
     data = df[df['날짜'].dt.year == latest_year].groupby('국가명')['수출량'].sum().reset_index()
-    data['GDP'] = data['국가명'].apply(lambda x: fetch_gdp_data(x) or 0)
+    # World Bank 일괄 조회 결과(디스크 스냅샷) 또는 CSV 의 GDP 값 사용
+    data['GDP'] = data['국가명'].map(get_gdp_map()).fillna(0)
     fig = px.scatter(data, x='GDP', y='수출량', size='수출량', color='국가명',
                      title="GDP 대비 수출량 분석",
                      labels={'GDP': 'GDP (10억$)', '수출량': '총 수출량'},
@@ -200,110 +173,26 @@ def filter_car_model_by_category(car_type_category, df):
     return sorted(filtered_data["차종"].unique())
 
 def load_data_and_models():
-    # 데이터 불러오기
-    df = pd.read_csv("hoyeon/기아.csv")
-    
-    # 데이터 전처리
-    id_vars = ['국가명', '연도', '기후대', 'GDP', '차종', '차량 구분']
-    month_cols = [f"{i}월" for i in range(1, 13)]
-    df_long = pd.melt(df, id_vars=id_vars, value_vars=month_cols, 
-                     var_name='월', value_name='수출량')
-    df_long['월'] = df_long['월'].str.replace('월', '').astype(int)
-    df_long['날짜'] = pd.to_datetime(df_long['연도'].astype(str) + '-' + df_long['월'].astype(str) + '-01')
-    df_long = df_long.sort_values(by=['국가명', '날짜'])
-    
-    # 시차/타겟 생성
-    df_long['전월_수출량'] = df_long.groupby('국가명')['수출량'].shift(1)
-    df_long['다음달_수출량'] = df_long.groupby('국가명')['수출량'].shift(-1)
-    df_model = df_long.dropna(subset=['전월_수출량', '다음달_수출량']).copy()
-    
-    # 특성 정의
-    features = ['수출량', '전월_수출량', '연도', '월', 'GDP', '국가명', '기후대', '차종', '차량 구분']
-    categorical_features = ['국가명', '기후대', '차종', '차량 구분']
-    
-    # 전체 데이터로 모델 학습 (실제로는 교차검증 필요)
-    X = df_model[features]
-    y = df_model['다음달_수출량']
-    
-    # 인코딩
-    X_encoded = pd.get_dummies(X, columns=categorical_features)
-    
-    # 스케일링
-    scaler = StandardScaler()
-    X_scaled = scaler.fit_transform(X_encoded)
-    
-    # 모델 학습
-    model = LGBMRegressor()
-    model.fit(X_scaled, y)
-    
-    return model, scaler, X_encoded.columns.tolist(), df_long
+    # 저장된 모델 아티팩트 사용 (기아.csv 나 학습 설정이 바뀐 경우에만 다시 학습)
+    artifact = load_artifact()
+    df_long = load_long()
+    export_index = load_export_index()
+    return artifact["model"], artifact["scaler"], artifact["columns"], df_long, export_index
 
-def predict(model, scaler, model_columns, df_long, country, climate, car_type, car_model, year, month, gdp):
+def predict(model, scaler, model_columns, export_index, country, climate, car_type, car_model, year, month, gdp):
     try:
-        # 현재 월 수출량 가져오기
-        current_export = df_long[
-            (df_long['국가명'] == country) &
-            (df_long['차량 구분'] == car_type) &
-            (df_long['차종'] == car_model) &
-            (df_long['연도'] == year) &
-            (df_long['월'] == month)
-        ]['수출량'].values[0] if not df_long[
-            (df_long['국가명'] == country) &
-            (df_long['차량 구분'] == car_type) &
-            (df_long['차종'] == car_model) &
-            (df_long['연도'] == year) &
-            (df_long['월'] == month)
-        ].empty else 0
-        
-        # 전월 수출량 가져오기
-        prev_month_export = df_long[
-            (df_long['국가명'] == country) &
-            (df_long['차량 구분'] == car_type) &
-            (df_long['차종'] == car_model) &
-            (df_long['연도'] == (year if month > 1 else year-1)) &
-            (df_long['월'] == (month-1 if month > 1 else 12))
-        ]['수출량'].values[0] if not df_long[
-            (df_long['국가명'] == country) &
-            (df_long['차량 구분'] == car_type) &
-            (df_long['차종'] == car_model) &
-            (df_long['연도'] == (year if month > 1 else year-1)) &
-            (df_long['월'] == (month-1 if month > 1 else 12))
-        ].empty else 0
-        
-        # 입력 데이터 준비
-        input_data = {
-            '수출량': current_export,
-            '전월_수출량': prev_month_export,
-            '연도': year,
-            '월': month,
-            'GDP': gdp,
+        scenario = pd.DataFrame([{
             '국가명': country,
             '기후대': climate,
+            '차량 구분': car_type,
             '차종': car_model,
-            '차량 구분': car_type
-        }
-        
-        input_df = pd.DataFrame([input_data])
-        
-        # 원핫 인코딩
-        input_encoded = pd.get_dummies(input_df, columns=['국가명', '기후대', '차종', '차량 구분'])
-        
-        # 모델에 필요한 컬럼 확인 및 추가
-        missing_cols = set(model_columns) - set(input_encoded.columns)
-        for col in missing_cols:
-            input_encoded[col] = 0
-        
-        # 컬럼 순서 정렬
-        input_encoded = input_encoded[model_columns]
-        
-        # 스케일링
-        input_scaled = scaler.transform(input_encoded)
-        
-        # 예측
-        prediction = model.predict(input_scaled)[0]
-        
-        return max(0, prediction)  # 음수 방지
-    
+            '연도': year,
+            '월': month,
+            'GDP': gdp
+        }])
+        # 단일 예측도 배치 예측기를 사용 (현재/전월 수출량 조회 포함)
+        return predict_batch(model, scaler, model_columns, scenario, export_index)[0]
+
     except Exception as e:
         st.error(f"예측 중 오류 발생: {str(e)}")
         return None
@@ -312,8 +201,10 @@ def reset_form():
     st.session_state.clear()
 
 def run_ho():
+    st.markdown(PAGE_CSS, unsafe_allow_html=True)
+
     # 모델 및 데이터 로드
-    model, scaler, model_columns, df_long = load_data_and_models()
+    model, scaler, model_columns, df_long, export_index = load_data_and_models()
     latest_year = df_long["날짜"].dt.year.max()
     
     st.title("🚗 기아 자동차 수출량 분석 대시보드")
@@ -356,21 +247,15 @@ def run_ho():
             
             # 예측 실행
             prediction = predict(
-                model, scaler, model_columns, df_long,
+                model, scaler, model_columns, export_index,
                 selected_country, selected_climate, selected_car_type, selected_car,
                 target_year, target_month, gdp_value
             )
             
             if prediction is not None:
                 # 전년 동월 데이터 가져오기
-                prev_year_data = df_long[
-                    (df_long["국가명"] == selected_country) &
-                    (df_long["차량 구분"] == selected_car_type) &
-                    (df_long["차종"] == selected_car) &
-                    (df_long["날짜"].dt.year == target_year - 1) &
-                    (df_long["날짜"].dt.month == target_month)
-                ]
-                prev_year_export = prev_year_data["수출량"].iloc[0] if not prev_year_data.empty else 0
+                prev_year_export = export_index.get(selected_country, selected_car_type, selected_car,
+                                                    target_year, target_month, lag=12)
                 
                 st.session_state.prediction_result = {
                     'selected_country': selected_country,
@@ -689,3 +574,26 @@ def run_ho():
             - 마케팅 캠페인 효과 측정에 활용
             """)
 
+            # 국가 × 월 시나리오를 한 번에 예측
+            st.markdown("#### 🔮 국가별 월별 예측 수출량 비교")
+            # 국가별 기후대·GDP 는 가장 최근 연도 값을 사용
+            country_info = (df_long[df_long["국가명"].isin(selected_countries)]
+                            .sort_values("날짜", ascending=False, kind="stable")
+                            .drop_duplicates("국가명")[["국가명", "기후대", "GDP"]])
+            scenarios = country_info.merge(pd.DataFrame({"월": range(1, 13)}), how="cross")
+            scenarios["연도"] = latest_year
+            scenarios["차량 구분"] = selected_car_type
+            scenarios["차종"] = selected_car
+            scenarios["예측 수출량"] = predict_batch(model, scaler, model_columns, scenarios, export_index)
+            fig_pred = px.line(scenarios,
+                               x="월", y="예측 수출량", color="국가명", markers=True,
+                               title=f"{selected_car_type} - {selected_car} {latest_year}년 기준 국가별 예측 수출량",
+                               labels={"예측 수출량": "예측 수출량", "월": "기준 월"},
+                               height=400, color_discrete_sequence=px.colors.qualitative.Plotly)
+            st.plotly_chart(fig_pred, use_container_width=True)
+            st.caption("""
+            **해석 방법:**  
+            - 각 월의 실적을 기준으로 모델이 예측한 다음 달 수출량  
+            - 선택한 모든 국가 × 12개월을 한 번에 예측  
+            - 국가 간 예측 수준과 계절 패턴 비교
+            """)
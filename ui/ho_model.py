@@ -0,0 +1,193 @@
+import glob
+import hashlib
+import json
+import os
+import tempfile
+import joblib
+import numpy as np
+import pandas as pd
+import streamlit as st
+from ui.catalog import get_table
+from ui.data_store import BASE_DIR, FILE_MODE, csv_path, file_sha256
+
+MODEL_DIR = os.path.join(BASE_DIR, "models")
+ARTIFACT_PREFIX = "ho_lgbm_"
+
+# 학습 설정 (값을 바꾸면 지문이 달라져 다음 실행 때 다시 학습)
+FEATURES = ['수출량', '전월_수출량', '연도', '월', 'GDP', '국가명', '기후대', '차종', '차량 구분']
+CATEGORICAL_FEATURES = ['국가명', '기후대', '차종', '차량 구분']
+MODEL_PARAMS = {}
+PIPELINE_VERSION = 1
+
+
+def make_long(df):
+    """기아 수출 데이터를 월 단위 long 포맷으로 변환"""
+    id_vars = ['국가명', '연도', '기후대', 'GDP', '차종', '차량 구분']
+    month_cols = [f"{i}월" for i in range(1, 13)]
+    df_long = pd.melt(df, id_vars=id_vars, value_vars=month_cols,
+                      var_name='월', value_name='수출량')
+    df_long['월'] = df_long['월'].str.replace('월', '').astype(int)
+    df_long['날짜'] = pd.to_datetime(df_long['연도'].astype(str) + '-' + df_long['월'].astype(str) + '-01')
+    return df_long.sort_values(by=['국가명', '날짜'])
+
+
+def fingerprint():
+    """입력 CSV 내용과 학습 설정으로 만든 지문 (CSV 가 그대로면 stat 한 번으로 끝남)"""
+    digest = hashlib.sha256(file_sha256(csv_path("기아")).encode("utf-8"))
+    settings = {
+        "features": FEATURES,
+        "categorical": CATEGORICAL_FEATURES,
+        "params": MODEL_PARAMS,
+        "version": PIPELINE_VERSION,
+    }
+    digest.update(json.dumps(settings, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def artifact_path(key):
+    return os.path.join(MODEL_DIR, f"{ARTIFACT_PREFIX}{key}.joblib")
+
+
+def train(df_long):
+    """시차 특성 생성 → 원핫 인코딩 → 스케일링 → LightGBM 학습"""
+    # 학습할 때만 필요하므로 여기서 임포트 (저장된 아티팩트만 쓰는 페이지는 임포트 비용이 없음)
+    from lightgbm import LGBMRegressor
+    from sklearn.preprocessing import StandardScaler
+
+    df_long = df_long.copy()
+    df_long['전월_수출량'] = df_long.groupby('국가명')['수출량'].shift(1)
+    df_long['다음달_수출량'] = df_long.groupby('국가명')['수출량'].shift(-1)
+    df_model = df_long.dropna(subset=['전월_수출량', '다음달_수출량'])
+
+    # 전체 데이터로 모델 학습 (실제로는 교차검증 필요)
+    X_encoded = pd.get_dummies(df_model[FEATURES], columns=CATEGORICAL_FEATURES)
+    y = df_model['다음달_수출량']
+
+    scaler = StandardScaler()
+    X_scaled = scaler.fit_transform(X_encoded)
+
+    model = LGBMRegressor(**MODEL_PARAMS)
+    model.fit(X_scaled, y)
+    return {"model": model, "scaler": scaler, "columns": X_encoded.columns.tolist()}
+
+
+def save_artifact(key, artifact):
+    """임시 파일에 쓴 뒤 교체하고, 지문이 다른 이전 아티팩트는 정리"""
+    os.makedirs(MODEL_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=MODEL_DIR, suffix=".joblib.tmp")
+    os.close(fd)
+    try:
+        joblib.dump(artifact, tmp_path)
+        os.chmod(tmp_path, FILE_MODE)
+        os.replace(tmp_path, artifact_path(key))
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    for old in glob.glob(os.path.join(MODEL_DIR, f"{ARTIFACT_PREFIX}*.joblib")):
+        if old != artifact_path(key):
+            os.remove(old)
+
+
+def build_artifact(key=None, force=False):
+    """지문에 해당하는 아티팩트를 읽고, 없으면 학습해서 저장"""
+    key = key or fingerprint()
+    path = artifact_path(key)
+    if not force and os.path.exists(path):
+        try:
+            return key, joblib.load(path)
+        except Exception:
+            pass
+    artifact = train(make_long(get_table("기아")))
+    artifact["fingerprint"] = key
+    try:
+        save_artifact(key, artifact)
+    except OSError:
+        # 쓰기 권한이 없으면 메모리에 있는 모델만 사용
+        pass
+    return key, artifact
+
+
+@st.cache_resource(show_spinner="예측 모델을 불러오는 중...")
+def _load_artifact(key):
+    return build_artifact(key)[1]
+
+
+def load_artifact():
+    """페이지에서 사용하는 모델/스케일러/컬럼 목록 (입력 CSV 가 바뀌면 다시 학습)"""
+    return _load_artifact(fingerprint())
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_long():
+    return make_long(get_table("기아"))
+
+
+KEY_COLUMNS = ['국가명', '차량 구분', '차종', '연도', '월']
+
+
+class ExportIndex:
+    """(국가명, 차량 구분, 차종, 연도, 월) → 수출량 조회 인덱스
+
+    같은 키가 여러 행이면 df_long 에서 먼저 나온 값을 사용하고, 없는 키는 0 을 반환합니다.
+    """
+
+    def __init__(self, df_long):
+        exports = df_long.drop_duplicates(KEY_COLUMNS).set_index(KEY_COLUMNS)['수출량']
+        self._series = exports
+        self._values = dict(zip(exports.index, exports.to_numpy()))
+
+    def get(self, country, car_type, car_model, year, month, lag=0):
+        """단건 조회 (lag 개월 전 값)"""
+        year, month = divmod(int(year) * 12 + int(month) - 1 - lag, 12)
+        return self._values.get((country, car_type, car_model, year, month + 1), 0)
+
+    def lookup(self, keys, lag=0):
+        """KEY_COLUMNS 가 있는 DataFrame 의 각 행에 대한 수출량 배열 (lag 개월 전 값)"""
+        keys = keys[KEY_COLUMNS].reset_index(drop=True)
+        if lag:
+            period = keys['연도'].astype('int64') * 12 + keys['월'].astype('int64') - 1 - lag
+            keys = keys.assign(연도=period // 12, 월=period % 12 + 1)
+        index = pd.MultiIndex.from_frame(keys)
+        return self._series.reindex(index).fillna(0).to_numpy()
+
+
+@st.cache_resource(show_spinner=False)
+def load_export_index():
+    return ExportIndex(load_long())
+
+
+def build_features(scenarios, columns):
+    """학습 때와 같은 컬럼 순서의 특성 행렬을 한 번에 채움 (원핫 컬럼은 위치만 1로 표시)"""
+    positions = {col: i for i, col in enumerate(columns)}
+    X = np.zeros((len(scenarios), len(columns)), dtype=np.float64)
+    rows = np.arange(len(scenarios))
+    for col in FEATURES:
+        if col in CATEGORICAL_FEATURES:
+            idx = scenarios[col].map(lambda value: positions.get(f"{col}_{value}", -1)).to_numpy()
+            known = idx >= 0
+            X[rows[known], idx[known]] = 1.0
+        else:
+            X[:, positions[col]] = scenarios[col].to_numpy(dtype=np.float64)
+    return X
+
+
+def predict_batch(model, scaler, model_columns, scenarios, exports=None):
+    """여러 시나리오(국가 × 차종 × 월 등)를 모델 한 번 호출로 예측
+
+    scenarios 컬럼: 국가명, 기후대, 차량 구분, 차종, 연도, 월, GDP
+    (수출량/전월_수출량이 없으면 exports(ExportIndex) 에서 찾아 채움)
+    반환값: 음수를 0으로 자른 예측값 배열
+    """
+    if exports is not None and '수출량' not in scenarios.columns:
+        scenarios = scenarios.reset_index(drop=True).assign(
+            수출량=exports.lookup(scenarios),
+            전월_수출량=exports.lookup(scenarios, lag=1),
+        )
+    X = build_features(scenarios, model_columns)
+    X_scaled = (X - scaler.mean_) / scaler.scale_
+    return np.maximum(model.predict(X_scaled), 0)
+
+
+if __name__ == "__main__":
+    key, artifact = build_artifact(force=True)
+    print(f"{artifact_path(key)}: 특성 {len(artifact['columns'])}개")
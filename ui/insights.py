@@ -0,0 +1,122 @@
+import numpy as np
+import streamlit as st
+from ui.catalog import get_catalog
+from ui.data_store import MONTH_COLUMNS
+
+NO_DATA = "데이터 부족"
+
+
+def year_slice(frame, year):
+    """('연도', ...) 멀티인덱스에서 한 연도만 꺼냄 (연도 레벨 제거, 해당 연도가 없으면 빈 프레임)"""
+    if year not in frame.index.get_level_values('연도'):
+        return frame.iloc[:0].droplevel('연도')
+    return frame.xs(year, level='연도')
+
+
+def _volatility(monthly, axis=0):
+    """월별 판매량의 변동성(%) = 표준편차 / 평균"""
+    return monthly.std(axis=axis) / monthly.mean(axis=axis) * 100
+
+
+class YearSummary:
+    """데이터셋 한 연도의 항목(공장·차종·국가 등)별 요약 통계
+
+    연도·항목 단위 한 번의 groupby 로 월별 합계, 연간 합계, 개수를 구해 두고
+    인사이트 문구는 속성과 메서드로 조회만 합니다. 성장률은 전년도 합계 기준입니다.
+    """
+
+    def __init__(self, df, entity, year, value, count=None):
+        self.entity = entity
+        self.year = year
+        agg = dict.fromkeys(MONTH_COLUMNS + [value], 'sum')
+        if count is not None:
+            agg[count] = 'nunique'
+        grouped = df[df['연도'].isin([year - 1, year])].groupby(['연도', entity]).agg(agg)
+        current, previous = year_slice(grouped, year), year_slice(grouped, year - 1)
+
+        self.monthly = current[MONTH_COLUMNS]
+        self.totals = current[value]
+        self.counts = current[count] if count is not None else None
+        self.total = self.totals.sum()
+        self.shares = self.totals / self.total * 100 if self.total else self.totals * np.nan
+        prev_totals = previous[value].reindex(self.totals.index)
+        self.growth = (self.totals - prev_totals) / prev_totals.where(prev_totals != 0) * 100
+        self.volatilities = _volatility(self.monthly, axis=1)
+
+        # 연도 전체(모든 항목 합계)의 월별 판매량
+        overall = self.monthly.sum()
+        self.volatility = _volatility(overall)
+        self.best_month = int(overall.idxmax()[:-1])
+        self.best_month_sales = overall.max()
+
+    @property
+    def top(self):
+        """연간 합계가 가장 큰 항목"""
+        return self.totals.idxmax()
+
+    @property
+    def top_value(self):
+        return self.totals.max()
+
+    @property
+    def bottom(self):
+        """연간 합계가 가장 작은 항목"""
+        return self.totals.idxmin()
+
+    @property
+    def bottom_value(self):
+        return self.totals.min()
+
+    @property
+    def fewest_count(self):
+        """count 컬럼의 고유 개수가 가장 적은 항목 (예: 생산 공장 수가 가장 적은 차종)"""
+        return self.counts.idxmin()
+
+    def total_of(self, key):
+        return self.totals.get(key, 0)
+
+    def share(self, key):
+        """항목의 연간 합계 비중(%)"""
+        return self.shares.get(key, np.nan)
+
+    def count(self, key):
+        return self.counts.get(key, 0)
+
+    def best_month_of(self, key):
+        """항목의 최고 판매월과 판매량 (월, 판매량)"""
+        monthly = self.monthly.loc[key]
+        return int(monthly.idxmax()[:-1]), monthly.max()
+
+    def volatility_of(self, key):
+        return self.volatilities.get(key, np.nan)
+
+    def growth_of(self, key):
+        """전년 대비 성장률(%). 전년 판매 기록이 없으면 NaN"""
+        return self.growth.get(key, np.nan)
+
+    def fastest_growing(self, keys=None):
+        """전년 대비 성장률이 가장 높은 항목 (keys 가 있으면 그 안에서)"""
+        growth = self.growth if keys is None else self.growth.reindex(keys)
+        growth = growth.dropna()
+        return growth.idxmax() if not growth.empty else NO_DATA
+
+    def spread(self, keys):
+        """항목 간 연간 합계 격차(%) = 표준편차 / 평균"""
+        return _volatility(self.totals.reindex(keys).dropna())
+
+
+@st.cache_resource(show_spinner=False, max_entries=256)
+def _year_summary(name, version, year, entity, value, count, where):
+    df = get_catalog().table(name)
+    for column, match in where:
+        df = df[df[column] == match]
+    return YearSummary(df, entity, year, value, count)
+
+
+def year_summary(name, year, entity, value, count=None, where=None):
+    """카탈로그 데이터셋의 연도별 YearSummary. (데이터셋 버전, 연도, 조건) 마다 한 번만 계산
+
+    where: {컬럼: 값} 으로 먼저 걸러낼 조건 (예: 특정 차종만)
+    """
+    where = tuple(sorted(where.items())) if where else ()
+    return _year_summary(name, get_catalog().version(name), int(year), entity, value, count, where)
@@ -0,0 +1,119 @@
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+import streamlit as st
+
+# 동시에 실행할 백그라운드 작업 수
+JOB_WORKERS = int(os.environ.get("JOB_WORKERS", "4"))
+# 끝난 작업을 보관하는 시간(초). 이후 새 작업을 등록할 때 정리
+JOB_RETENTION = 3600
+
+
+class Job:
+    """백그라운드 작업 상태 (작업 함수가 progress/message/partial 을 갱신)"""
+
+    def __init__(self, label):
+        self.id = uuid.uuid4().hex
+        self.label = label
+        self.status = "대기"
+        self.progress = 0.0
+        self.message = ""
+        self.partial = ""
+        self.result = None
+        self.error = None
+        self.created = time.time()
+        self.finished = None
+
+    @property
+    def done(self):
+        return self.status in ("완료", "실패")
+
+    def update(self, progress=None, message=None):
+        if progress is not None:
+            self.progress = min(max(progress, 0.0), 1.0)
+        if message is not None:
+            self.message = message
+
+
+class JobRunner:
+    """프로세스 공용 작업 큐: 스크립트 스레드 밖(스레드 풀)에서 작업을 실행하고 ID 로 조회"""
+
+    def __init__(self, max_workers=JOB_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, fn, *args, label="", **kwargs):
+        """fn(*args, job=job, **kwargs) 를 백그라운드에서 실행하고 작업 ID 반환"""
+        job = Job(label)
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+        self._executor.submit(self._run, job, fn, args, kwargs)
+        return job.id
+
+    def _run(self, job, fn, args, kwargs):
+        job.status = "실행 중"
+        try:
+            job.result = fn(*args, job=job, **kwargs)
+            job.progress = 1.0
+            job.status = "완료"
+        except Exception as e:
+            job.error = str(e)
+            job.status = "실패"
+        finally:
+            job.finished = time.time()
+
+    def _prune(self):
+        now = time.time()
+        for job_id in [job_id for job_id, job in self._jobs.items()
+                       if job.finished and now - job.finished > JOB_RETENTION]:
+            del self._jobs[job_id]
+
+    def get(self, job_id):
+        return self._jobs.get(job_id)
+
+
+@st.cache_resource(show_spinner=False)
+def get_job_runner():
+    return JobRunner()
+
+
+def submit_job(name, fn, *args, label="", **kwargs):
+    """작업을 등록하고 세션에 name 으로 작업 ID 를 기록 (다음 rerun 에서 결과를 가져갈 수 있음)"""
+    job_id = get_job_runner().submit(fn, *args, label=label, **kwargs)
+    st.session_state.setdefault("jobs", {})[name] = job_id
+    return job_id
+
+
+def get_job(name):
+    job_id = st.session_state.get("jobs", {}).get(name)
+    return get_job_runner().get(job_id) if job_id else None
+
+
+def clear_job(name):
+    st.session_state.get("jobs", {}).pop(name, None)
+
+
+def render_job_progress(name, show_partial=False):
+    """실행 중인 작업의 진행 상황을 1초마다 갱신해서 표시하고, 끝나면 페이지를 다시 실행
+
+    반환값: 세션에 등록된 작업 (없으면 None)
+    """
+    job = get_job(name)
+    if job is None or job.done:
+        return job
+
+    @st.fragment(run_every=1.0)
+    def poll():
+        current = get_job(name)
+        if current is None or current.done:
+            st.rerun()
+        st.progress(current.progress, text=current.message or f"{current.label} ({current.status})")
+        if show_partial and current.partial:
+            st.markdown(current.partial)
+
+    poll()
+    return job
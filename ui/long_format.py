@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+MONTHS = ['1월', '2월', '3월', '4월', '5월', '6월', '7월', '8월', '9월', '10월', '11월', '12월']
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def melt_monthly(df, id_vars, value_name='판매량', start=None, end=None):
+    """월 컬럼(1월~12월)이 있는 wide 테이블을 '연도-월' 이 붙은 long 포맷으로 변환
+
+    - id_vars: 유지할 컬럼 (예: '차종', '차량 모델')
+    - start, end: '연도-월' 기준 포함 범위 (예: '2023-01-01', '2025-03')
+    반환 컬럼: id_vars, 연도, 월, value_name, 연도-월 (연도-월 순으로 정렬)
+    """
+    if isinstance(id_vars, str):
+        id_vars = [id_vars]
+    id_vars = [col for col in id_vars if col != '연도'] + ['연도']
+    start = pd.Timestamp(start) if start is not None else None
+    end = pd.Timestamp(end) if end is not None else None
+
+    # 범위 밖의 연도는 녹이기 전에 제외
+    if start is not None:
+        df = df[df['연도'] >= start.year]
+    if end is not None:
+        df = df[df['연도'] <= end.year]
+
+    month_cols = [month for month in MONTHS if month in df.columns]
+    melted = df.melt(id_vars=id_vars, value_vars=month_cols, value_name=value_name)
+
+    # melt 는 월 컬럼 순서대로 행을 쌓으므로 월 번호를 반복해서 바로 만들 수 있음
+    month_nums = np.repeat([MONTHS.index(month) + 1 for month in month_cols], len(df))
+    melted = melted.drop(columns='variable')
+    melted.insert(len(id_vars), '월', month_nums)
+    year_nums = melted['연도'].to_numpy(dtype='int64')
+    melted['연도-월'] = ((year_nums - 1970) * 12 + month_nums - 1).astype('datetime64[M]').astype('datetime64[ns]')
+
+    if start is not None:
+        melted = melted[melted['연도-월'] >= start]
+    if end is not None:
+        melted = melted[melted['연도-월'] <= end]
+    return melted.sort_values('연도-월', kind='stable', ignore_index=True)
@@ -0,0 +1,79 @@
+import os
+import pickle
+import threading
+from collections import OrderedDict
+import streamlit as st
+
+# 동시에 메모리에 올려둘 모델 수 (환경 변수로 조정)
+MODEL_POOL_SIZE = int(os.environ.get("MODEL_POOL_SIZE", "16"))
+
+
+class ModelPool:
+    """pickle 모델을 프로세스당 한 번만 읽어 두는 LRU 풀
+
+    파일 경로를 키로 사용하고, 파일이 수정되면(mtime 변경) 다시 읽습니다.
+    capacity 를 넘으면 가장 오래 사용하지 않은 모델부터 내립니다.
+    """
+
+    def __init__(self, capacity=MODEL_POOL_SIZE):
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._models = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path):
+        mtime = os.path.getmtime(path)
+        with self._lock:
+            entry = self._models.get(path)
+            if entry is not None and entry[0] == mtime:
+                self._models.move_to_end(path)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        with open(path, "rb") as f:
+            model = pickle.load(f)
+
+        with self._lock:
+            self._models[path] = (mtime, model)
+            self._models.move_to_end(path)
+            while len(self._models) > self.capacity:
+                self._models.popitem(last=False)
+                self.evictions += 1
+        return model
+
+    def warm(self, paths):
+        """백그라운드 스레드에서 모델을 미리 읽어 둠"""
+        def load_all():
+            for path in paths:
+                if os.path.exists(path):
+                    try:
+                        self.get(path)
+                    except Exception as e:
+                        print(f"[model_pool] {os.path.basename(path)} 로드 실패: {e}")
+
+        thread = threading.Thread(target=load_all, name="model-pool-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def stats(self):
+        with self._lock:
+            return {
+                "resident": len(self._models),
+                "capacity": self.capacity,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+@st.cache_resource(show_spinner=False)
+def get_model_pool():
+    return ModelPool()
+
+
+def load_pickle_model(path):
+    """풀을 거쳐 pickle 모델을 불러옴"""
+    return get_model_pool().get(path)
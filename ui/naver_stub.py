@@ -0,0 +1,80 @@
+"""네이버 뉴스 검색 API 로컬 스텁 서버 (오프라인 테스트/벤치마크용)
+
+    python -m ui.naver_stub --port 8002 --delay 0.05
+    NAVER_NEWS_URL=http://127.0.0.1:8002/v1/search/news.json streamlit run app.py
+    NAVER_NEWS_URL=http://127.0.0.1:8002/v1/search/news.json python -m ui.news_prefetch
+"""
+import argparse
+import json
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+NEWS_PATH = "/v1/search/news.json"
+
+
+def make_items(query, display, start):
+    """네이버 응답 형식의 가짜 기사 목록 (제목에 검색어를 <b> 로 강조)"""
+    return [{
+        "title": f"<b>{query}</b> 관련 기사 {start + i}",
+        "originallink": f"https://example.com/news/{start + i}",
+        "link": f"https://example.com/news/{start + i}",
+        "description": f"{query} 에 대한 스텁 기사 본문입니다. 수출 동향과 시장 전망을 다룹니다.",
+        "pubDate": formatdate(time.time() - i * 3600, localtime=True),
+    } for i in range(display)]
+
+
+def make_handler(delay):
+    class StubHandler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _send_json(self, status, body):
+            data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path.rstrip("/") != NEWS_PATH:
+                self._send_json(404, {"errorMessage": "not found", "errorCode": "404"})
+                return
+            if not self.headers.get("X-Naver-Client-Id") or not self.headers.get("X-Naver-Client-Secret"):
+                self._send_json(401, {"errorMessage": "Not Exist Client ID", "errorCode": "024"})
+                return
+            params = {key: values[0] for key, values in parse_qs(url.query).items()}
+            query = params.get("query", "")
+            display = int(params.get("display", 10))
+            start = int(params.get("start", 1))
+            time.sleep(delay)
+            self._send_json(200, {
+                "lastBuildDate": formatdate(localtime=True),
+                "total": 1000,
+                "start": start,
+                "display": display,
+                "items": make_items(query, display, start),
+            })
+
+    return StubHandler
+
+
+def start_stub_server(port=0, delay=0.0):
+    """백그라운드 스레드로 스텁 서버를 띄우고 (server, 뉴스 검색 URL) 반환"""
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(delay))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}{NEWS_PATH}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="네이버 뉴스 검색 API 로컬 스텁 서버")
+    parser.add_argument("--port", type=int, default=8002)
+    parser.add_argument("--delay", type=float, default=0.05, help="응답 지연(초)")
+    args = parser.parse_args()
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), make_handler(args.delay))
+    print(f"NAVER_NEWS_URL=http://127.0.0.1:{args.port}{NEWS_PATH}")
+    server.serve_forever()
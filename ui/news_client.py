@@ -0,0 +1,170 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future
+import requests
+import streamlit as st
+from requests.adapters import HTTPAdapter
+from ui.data_store import BASE_DIR
+
+# NAVER_NEWS_URL 환경 변수로 로컬 스텁 서버(ui.naver_stub)를 지정할 수 있음
+NEWS_URL = os.environ.get("NAVER_NEWS_URL", "https://openapi.naver.com/v1/search/news.json")
+# (연결, 읽기) 타임아웃 초 — 뉴스 API 가 느려도 페이지가 오래 멈추지 않도록 짧게 설정
+NEWS_TIMEOUT = (2, 4)
+NEWS_TTL = int(os.environ.get("NEWS_TTL", "600"))
+# 실패한 요청은 짧게만 기억해서 매 rerun 마다 타임아웃을 기다리지 않도록 함
+NEWS_ERROR_TTL = 60
+# 디스크 캐시 위치 (빈 문자열이면 메모리 캐시만 사용)
+NEWS_CACHE_DIR = os.environ.get("NEWS_CACHE_DIR", os.path.join(BASE_DIR, ".cache", "news"))
+
+
+def _credentials():
+    """네이버 API 인증 헤더 (secrets 가 없으면 None)"""
+    try:
+        return {
+            "X-Naver-Client-Id": st.secrets["X-Naver-Client-Id"],
+            "X-Naver-Client-Secret": st.secrets["X-Naver-Client-Secret"],
+        }
+    except (KeyError, OSError):
+        return None
+
+
+class NewsClient:
+    """네이버 뉴스 검색 클라이언트
+
+    - 연결을 재사용하는 requests.Session
+    - 검색어별 TTL 캐시 (메모리 + 선택적 디스크 캐시)
+    - 같은 검색어를 동시에 요청하면 한 번만 호출하고 결과를 공유
+
+    credentials 를 넘기지 않으면 요청할 때마다 st.secrets 의 네이버 API 키를 사용합니다.
+    """
+
+    def __init__(self, url=NEWS_URL, ttl=NEWS_TTL, cache_dir=NEWS_CACHE_DIR, timeout=NEWS_TIMEOUT,
+                 credentials=None):
+        self.url = url
+        self.credentials = credentials
+        self.ttl = ttl
+        self.cache_dir = cache_dir
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        self.session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        self._cache = {}
+        self._inflight = {}
+        self._lock = threading.Lock()
+
+    def has_credentials(self):
+        return (self.credentials or _credentials()) is not None
+
+    @staticmethod
+    def cache_key(query, display=5, start=1, sort="date"):
+        return f"{query}|{display}|{start}|{sort}"
+
+    def _disk_path(self, key):
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json")
+
+    def _read_disk(self, key):
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._disk_path(key), encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - cached["fetched_at"] > self.ttl:
+            return None
+        return cached
+
+    def _write_disk(self, key, fetched_at, payload):
+        if not self.cache_dir:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = self._disk_path(key) + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"fetched_at": fetched_at, "payload": payload}, f, ensure_ascii=False)
+            os.replace(tmp_path, self._disk_path(key))
+        except OSError:
+            pass
+
+    def get_cached(self, key):
+        """만료되지 않은 캐시 값 (없으면 None). 실패 결과는 (None, True) 로 구분"""
+        entry = self._cache.get(key)
+        if entry is not None and entry[0] > time.time():
+            return entry[1], True
+        cached = self._read_disk(key)
+        if cached is not None:
+            self.store(key, cached["payload"], cached["fetched_at"], persist=False)
+            return cached["payload"], True
+        return None, False
+
+    def store(self, key, payload, fetched_at=None, persist=True):
+        """검색 결과를 캐시에 저장 (payload 가 None 이면 실패로 짧게 기억)"""
+        fetched_at = fetched_at or time.time()
+        ttl = self.ttl if payload is not None else NEWS_ERROR_TTL
+        with self._lock:
+            self._cache[key] = (fetched_at + ttl, payload)
+        if persist and payload is not None:
+            self._write_disk(key, fetched_at, payload)
+
+    def _request(self, query, display, start, sort):
+        headers = self.credentials or _credentials()
+        if headers is None:
+            print(f"[news] '{query}' 요청 생략: 네이버 API secrets 가 설정되지 않았습니다.")
+            return None
+        params = {"query": query, "display": display, "start": start, "sort": sort}
+        try:
+            response = self.session.get(self.url, headers=headers, params=params, timeout=self.timeout)
+            response.raise_for_status()
+            return response.json()
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f"[news] '{query}' 요청 실패: {e}")
+            return None
+
+    def search(self, query, display=5, start=1, sort="date", refresh=False):
+        """뉴스 검색 결과(JSON dict). 실패하면 None
+
+        refresh=True 면 캐시를 건너뛰고 새로 받아 캐시를 갱신합니다. (미리 받아두기 용도)
+        """
+        key = self.cache_key(query, display, start, sort)
+        if not refresh:
+            payload, hit = self.get_cached(key)
+            if hit:
+                return payload
+
+        with self._lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not owner:
+            # 같은 검색어를 이미 요청 중이면 그 결과를 기다림
+            return future.result()
+
+        try:
+            payload = self._request(query, display, start, sort)
+            if payload is not None or not refresh:
+                # 갱신 요청이 실패하면 기존 캐시 값을 유지
+                self.store(key, payload)
+            future.set_result(payload)
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+        return payload
+
+
+@st.cache_resource(show_spinner=False)
+def get_news_client():
+    return NewsClient()
+
+
+def search_news(query, display=5, start=1, sort="date"):
+    """모든 페이지가 공통으로 사용하는 뉴스 검색 함수"""
+    return get_news_client().search(query, display=display, start=start, sort=sort)
@@ -0,0 +1,83 @@
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import streamlit as st
+from ui.catalog import get_table
+from ui.forecast_store import MARKET_LABEL_MAP
+from ui.news_client import NEWS_TTL, get_news_client
+from ui.news_queries import get_news_query, market_news_query
+
+# 동시에 보낼 최대 요청 수
+PREFETCH_CONCURRENCY = 8
+# 캐시가 만료되기 전에 다시 받아오도록 TTL 보다 짧은 주기로 실행
+PREFETCH_INTERVAL = max(60, int(NEWS_TTL * 0.8))
+
+
+def default_queries():
+    """페이지에서 사용하는 뉴스 검색어 전체 (검색어, 표시 개수)"""
+    # 지역별 예측 페이지: 시장별 검색어
+    queries = [(market_news_query(label), 5) for label in MARKET_LABEL_MAP]
+
+    # 시장 트렌드 페이지: 지역별 검색어 + 지역 × 파워트레인 검색어
+    data = get_table("수출 주요 국가 차량 판매량 순위")
+    for region in data['국가명'].unique():
+        queries.append((get_news_query(region), 5))
+        for powertrain in data['파워트레인'].unique():
+            queries.append((get_news_query(region, '파워트레인', powertrain), 5))
+    return list(dict.fromkeys(queries))
+
+
+async def _prefetch(client, queries, executor):
+    # 동시 요청 수는 executor 의 스레드 수로 제한됨
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(*(
+        loop.run_in_executor(executor, functools.partial(client.search, query, display, refresh=True))
+        for query, display in queries
+    ))
+
+
+def prefetch_news(queries=None, client=None, concurrency=PREFETCH_CONCURRENCY):
+    """검색어들을 동시에(최대 concurrency 개) 받아 공용 뉴스 캐시를 채움
+
+    반환값: (성공 수, 전체 수)
+    """
+    client = client or get_news_client()
+    queries = queries if queries is not None else default_queries()
+    # asyncio 기본 executor 는 min(32, CPU 수 + 4) 스레드라 CPU 가 적은 서버에서는
+    # concurrency 보다 적게 동시에 보내므로, 요청 수에 맞춘 전용 스레드 풀을 사용
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="news-fetch") as executor:
+        results = asyncio.run(_prefetch(client, queries, executor))
+    return sum(result is not None for result in results), len(results)
+
+
+@st.cache_resource(show_spinner=False)
+def start_news_prefetcher(interval=PREFETCH_INTERVAL):
+    """서버 시작 시 한 번 실행되어 interval 초마다 뉴스 캐시를 갱신하는 백그라운드 스레드
+
+    네이버 API secrets 가 없으면 모든 요청이 생략되므로 스레드를 만들지 않고 None 을 반환합니다.
+    """
+    client = get_news_client()
+    if not client.has_credentials():
+        print("[news] 네이버 API secrets 가 없어 뉴스 미리 받기를 시작하지 않습니다.")
+        return None
+
+    def loop():
+        while True:
+            try:
+                started = time.time()
+                ok, total = prefetch_news(client=client)
+                print(f"[news] {ok}/{total}개 검색어 미리 받기 ({time.time() - started:.1f}초)")
+            except Exception as e:
+                print(f"[news] 미리 받기 실패: {e}")
+            time.sleep(interval)
+
+    thread = threading.Thread(target=loop, name="news-prefetch", daemon=True)
+    thread.start()
+    return thread
+
+
+if __name__ == "__main__":
+    ok, total = prefetch_news()
+    print(f"{ok}/{total}개 검색어 미리 받기 완료")
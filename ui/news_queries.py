@@ -0,0 +1,34 @@
+# 페이지와 뉴스 미리 받기(ui.news_prefetch)가 함께 쓰는 뉴스 검색어 규칙
+# (페이지 모듈을 임포트하지 않고도 같은 검색어를 만들 수 있도록 분리)
+
+# 대륙별 국가 매핑
+continent_mapping = {
+    'Asia': ['China', 'India', 'Japan', 'South Korea', 'Thailand'],
+    'Europe': ['Germany', 'France', 'UK', 'Italy', 'Spain'],
+    'Africa': ['South Africa', 'Egypt', 'Nigeria', 'Morocco', 'Algeria'],
+    'North America': ['USA', 'Canada', 'Mexico'],
+    'South America': ['Brazil', 'Argentina', 'Chile', 'Colombia', 'Peru'],
+    'Oceania': ['Australia', 'New Zealand', 'Fiji']
+}
+
+
+def market_news_query(label):
+    """지역별 예측 페이지의 시장 뉴스 검색어"""
+    return f"{label} 자동차 수출"
+
+
+# 공통 뉴스 쿼리 생성 함수
+def get_news_query(region, column=None, value=None):
+    if region in continent_mapping:
+        base_query = region + " 자동차 수출 시장"
+    else:
+        for continent, countries in continent_mapping.items():
+            if region in countries:
+                base_query = continent + " 자동차 수출 시장"
+                break
+        else:
+            base_query = region + " 자동차 수출 시장"
+    
+    if column == '파워트레인' and value:
+        return f"{region} {value} 자동차 수출"
+    return base_query
@@ -0,0 +1,89 @@
+"""OpenAI Chat Completions 로컬 스텁 서버 (오프라인 테스트/벤치마크용)
+
+    python -m ui.openai_stub --port 8001 --delay 0.02
+    OPENAI_BASE_URL=http://127.0.0.1:8001/v1 streamlit run app.py
+"""
+import argparse
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+STUB_REPORT = """1. {market} 시장 예측 분석
+{market} 시장은 최근 수출 실적과 예측 추세를 기준으로 안정적인 수요를 보이고 있습니다.
+
+2. **최근 동향 요약**
+최근 뉴스에서는 환율, 물류, 친환경차 정책 변화가 주요 이슈로 다뤄지고 있습니다.
+
+3. **선택된 시점 ±1분기 예측 분석**
+예측 구간 동안 계절적 요인에 따라 월별 변동이 나타날 것으로 보입니다.
+
+4. **전략적 제안**
+주력 차종 공급을 안정적으로 유지하고, 현지 맞춤형 프로모션을 강화하는 것이 좋습니다.
+"""
+
+
+def make_handler(delay):
+    class StubHandler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _send_json(self, status, body):
+            data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_POST(self):
+            if not self.path.rstrip("/").endswith("/chat/completions"):
+                self._send_json(404, {"error": {"message": "not found"}})
+                return
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            prompt = request.get("messages", [{}])[-1].get("content", "")
+            market = re.search(r"시장명:\s*(\S+)", prompt)
+            text = STUB_REPORT.format(market=market.group(1) if market else "해당")
+            base = {"id": "chatcmpl-stub", "created": int(time.time()), "model": request.get("model", "stub")}
+
+            if not request.get("stream"):
+                self._send_json(200, {
+                    **base, "object": "chat.completion",
+                    "choices": [{"index": 0, "finish_reason": "stop",
+                                 "message": {"role": "assistant", "content": text}}],
+                })
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+            for token in re.findall(r"\S+\s*", text):
+                chunk = {**base, "object": "chat.completion.chunk",
+                         "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}]}
+                self.wfile.write(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+                time.sleep(delay)
+            done = {**base, "object": "chat.completion.chunk",
+                    "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}
+            self.wfile.write(f"data: {json.dumps(done)}\n\ndata: [DONE]\n\n".encode("utf-8"))
+            self.wfile.flush()
+
+    return StubHandler
+
+
+def start_stub_server(port=0, delay=0.0):
+    """백그라운드 스레드로 스텁 서버를 띄우고 (server, base_url) 반환"""
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(delay))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}/v1"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="OpenAI Chat Completions 로컬 스텁 서버")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--delay", type=float, default=0.02, help="토큰 사이 지연(초)")
+    args = parser.parse_args()
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), make_handler(args.delay))
+    print(f"OPENAI_BASE_URL=http://127.0.0.1:{args.port}/v1")
+    server.serve_forever()
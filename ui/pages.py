@@ -0,0 +1,57 @@
+import argparse
+import importlib
+import subprocess
+import sys
+import time
+from ui.data_store import BASE_DIR
+
+# 메뉴 이름 -> (모듈, 실행 함수, 메뉴 아이콘). 사이드바 메뉴는 이 순서대로 만들고,
+# 모듈은 페이지가 처음 선택될 때 임포트
+PAGES = {
+    "홈": ("ui.home", "run_home", "house"),
+    "지역별 예측": ("ui.prediction_region", "run_prediction_region", "geo-alt"),
+    "기후별 예측": ("ui.ho", "run_ho", "cloud-sun"),
+    "기아 분석": ("ui.eda_kia", "run_eda_kia", "truck-front-fill"),
+    "현대 분석": ("ui.eda_hyundai", "run_eda_hyundai", "car-front"),
+    "시장 트렌드": ("ui.trend", "run_trend", "graph-up-arrow"),
+    "프로젝트 개발과정": ("ui.description", "run_description", "tools"),
+}
+
+# 모듈별 첫 임포트 시간(초)
+import_times = {}
+
+
+def load_page(name):
+    """페이지 실행 함수. 모듈이 아직 임포트되지 않았으면 이때 임포트하고 걸린 시간을 기록"""
+    module_name, func_name, _ = PAGES[name]
+    if module_name not in sys.modules:
+        started = time.perf_counter()
+        importlib.import_module(module_name)
+        import_times[module_name] = time.perf_counter() - started
+        print(f"[pages] {module_name} 임포트 {import_times[module_name]:.2f}s")
+    return getattr(sys.modules[module_name], func_name)
+
+
+def measure_import(module_name):
+    """새 파이썬 프로세스에서 모듈 하나를 임포트하는 데 걸리는 시간(초)"""
+    code = (
+        "import time, importlib, streamlit, pandas; "
+        f"started = time.perf_counter(); importlib.import_module({module_name!r}); "
+        "print(time.perf_counter() - started)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=BASE_DIR, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="페이지 모듈별 임포트 시간 측정 (streamlit, pandas 임포트 제외)")
+    parser.add_argument("pages", nargs="*", help="측정할 메뉴 이름 (기본: 전체)")
+    args = parser.parse_args()
+    for name in args.pages or PAGES:
+        module_name = PAGES[name][0]
+        try:
+            print(f"{name:<12} {module_name:<22} {measure_import(module_name):6.2f}s")
+        except RuntimeError as e:
+            print(f"{name:<12} {module_name:<22} 실패: {e}")
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+from ui.insights import NO_DATA, year_slice
+
+
+class PowertrainShares:
+    """국가×연도×파워트레인 판매량·비중 행렬
+
+    한 번의 pivot 으로 만들어 두고 인사이트 문구와 차트는 조회만 합니다.
+    판매 기록이 없는 조합은 NaN 으로 남겨 차트에서 원래처럼 제외할 수 있게 합니다.
+    """
+
+    def __init__(self, df, value='월별합계'):
+        self.value = value
+        self.sales = df.pivot_table(index=['국가명', '연도'], columns='파워트레인', values=value,
+                                    aggfunc='sum', observed=True)
+        self.totals = self.sales.sum(axis=1)
+        # 국가·연도 합계가 0 이면 0/0 = NaN (기존 계산과 동일)
+        self.shares = self.sales.fillna(0).div(self.totals.replace(0, np.nan), axis=0)
+
+    def sales_of(self, country, year, powertrain):
+        """국가·연도의 파워트레인 판매량 (없으면 0)"""
+        value = self.sales[powertrain].get((country, year), np.nan) if powertrain in self.sales else np.nan
+        return 0 if pd.isna(value) else value
+
+    def share(self, country, year, powertrain):
+        """국가·연도의 파워트레인 비중(%). 판매 기록이 없으면 NaN"""
+        if powertrain not in self.shares:
+            return np.nan
+        return self.shares[powertrain].get((country, year), np.nan) * 100
+
+    def global_share(self, year, powertrain):
+        """연도 전체 국가 합계 기준 파워트레인 비중(%)"""
+        table = year_slice(self.sales, year)
+        if powertrain not in table:
+            return 0.0
+        return table[powertrain].sum() / table.sum().sum() * 100
+
+    def leader(self, year, powertrain):
+        """연도 기준 파워트레인 비중이 가장 높은 국가"""
+        shares = year_slice(self.shares, year)
+        if powertrain not in shares or shares[powertrain].isna().all():
+            return NO_DATA
+        return shares[powertrain].idxmax()
+
+    def country_year(self, country, year):
+        """국가·연도의 파워트레인별 판매량 표 (판매 기록이 있는 파워트레인만)"""
+        if (country, year) not in self.sales.index:
+            return pd.DataFrame(columns=['파워트레인', self.value])
+        row = self.sales.loc[(country, year)].dropna()
+        return row.astype('int64').rename(self.value).rename_axis('파워트레인').reset_index()
+
+    def country_trend(self, country):
+        """국가의 연도 × 파워트레인 판매량 (한 번도 팔리지 않은 파워트레인은 제외)"""
+        if country not in self.sales.index.get_level_values('국가명'):
+            return pd.DataFrame()
+        return self.sales.loc[country].dropna(axis=1, how='all').fillna(0)
+
+    def top_countries(self, year, n=10):
+        """연도 총판매량 상위 n 개 국가의 국가 × 파워트레인 판매량 (long 포맷)"""
+        totals = year_slice(self.totals, year)
+        table = year_slice(self.sales, year)
+        table = table[table.index.isin(totals.nlargest(n).index)]
+        return table.stack().astype('int64').rename(self.value).reset_index()
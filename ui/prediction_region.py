@@ -1,53 +1,39 @@
+import hashlib
 import os
-import tempfile
-from fpdf import FPDF
+import threading
+from collections import OrderedDict
 import streamlit as st
 import pandas as pd
-import pickle
 import plotly.graph_objects as go
-import requests
-from prophet import Prophet
-from openai import OpenAI
+from plotly.subplots import make_subplots
 from streamlit_option_menu import option_menu
 import datetime
 import re
-
-client = OpenAI(api_key=st.secrets["OPENAI_API_KEY"])
+from ui.ai_report import generate_report, get_openai_client, read_cached_report
+from ui.catalog import get_table
+from ui.fonts import register_pdf_fonts
+from ui.jobs import clear_job, render_job_progress, submit_job
+from ui.news_client import search_news
+from ui.news_queries import market_news_query
+from ui.forecast_store import MARKETS, MARKET_LABEL_MAP, FORECAST_PERIODS, forecast_totals, load_all_forecasts, load_forecast, model_path
 
 TEST_MODE = False
 
+# 보고서 내용 해시 -> PDF 바이트 (프로세스 공용, 최근 사용 순)
+PDF_CACHE_SIZE = 32
+_pdf_cache = OrderedDict()
+_pdf_lock = threading.Lock()
+
 def clean_text(text):
     # 유니코드 이모지 및 특수기호 제거
     return re.sub(r"[^\u0000-\uD7FF\uE000-\uFFFF]", "", text)
 
-def load_model(channel, selected_market, model_dir):
-    channel_key_map = {
-        "현대": "hyundai",
-        "기아": "kia"
-    }
-    channel_key = channel_key_map[channel]
-    filename = f"{channel_key}_{selected_market}_model.pkl"
-    model_path = os.path.join(model_dir, filename)
-
-    if not os.path.exists(model_path):
-        st.error(f"❌ 해당 모델 파일이 존재하지 않습니다: {filename}")
-        return None
-
-    with open(model_path, "rb") as f:
-        model = pickle.load(f)
-    return model
-
-def load_sales_data(csv_path, selected_market):
-    df = pd.read_csv(csv_path)
+def load_sales_data(table_name, selected_market):
+    df = get_table(table_name)
     df["ds"] = pd.to_datetime(df["ds"])
     df = df[df["국가"] == selected_market][["ds", "y"]].copy()
     return df
 
-def create_forecast(model, periods=18, freq="ME"):
-    future = model.make_future_dataframe(periods=periods, freq=freq)
-    forecast = model.predict(future)
-    return forecast
-
 def plot_forecast(df_actual, forecast, selected_market):
     fig = go.Figure()
     fig.add_trace(go.Scatter(
@@ -78,25 +64,151 @@ def plot_forecast(df_actual, forecast, selected_market):
     )
     return fig
 
+def plot_all_markets(table):
+    """전체 시장 예측 small multiples (시장별 현대/기아 예측선)"""
+    colors = {"현대": "#2E86C1", "기아": "#E67E22"}
+    fig = make_subplots(rows=2, cols=4, subplot_titles=MARKETS, shared_xaxes=True)
+    for i, market in enumerate(MARKETS):
+        row, col = divmod(i, 4)
+        for brand, color in colors.items():
+            data = table[(table["브랜드"] == brand) & (table["시장"] == market)]
+            fig.add_trace(go.Scatter(
+                x=data["ds"], y=data["yhat"], mode="lines", name=brand,
+                line=dict(color=color), legendgroup=brand, showlegend=(i == 0)
+            ), row=row + 1, col=col + 1)
+    fig.update_layout(
+        title="전체 시장 수출 실적 예측 (현대 vs 기아)",
+        height=600, template="plotly_white",
+        legend=dict(orientation="h", y=1.08, x=0.5, xanchor="center")
+    )
+    fig.update_xaxes(tickformat="%Y-%m")
+    return fig
+
+def pdf_bytes(pdf):
+    """FPDF 출력을 bytes 로 변환 (pyfpdf 는 str, fpdf2 는 bytearray 를 반환)"""
+    output = pdf.output(dest='S')
+    return output.encode('latin-1') if isinstance(output, str) else bytes(output)
+
+def report_pdf_key(report_text):
+    return hashlib.sha256(report_text.encode("utf-8")).hexdigest()
+
+def cached_report_pdf(report_text):
+    """같은 보고서 내용으로 이미 만든 PDF (없으면 None)"""
+    key = report_pdf_key(report_text)
+    with _pdf_lock:
+        pdf = _pdf_cache.get(key)
+        if pdf is not None:
+            _pdf_cache.move_to_end(key)
+        return pdf
+
+def get_report_pdf(report_text, job=None):
+    """보고서 PDF 바이트. 내용 해시가 같으면 다시 레이아웃하지 않고 캐시 값을 반환"""
+    pdf = cached_report_pdf(report_text)
+    if pdf is None:
+        pdf = build_report_pdf(report_text, job=job)
+        with _pdf_lock:
+            _pdf_cache[report_pdf_key(report_text)] = pdf
+            while len(_pdf_cache) > PDF_CACHE_SIZE:
+                _pdf_cache.popitem(last=False)
+    return pdf
+
+def build_report_pdf(report_text, job=None):
+    """AI 분석 보고서 PDF 바이트 생성 (백그라운드 작업에서도 실행 가능)"""
+    from fpdf import FPDF
+
+    # PDF 설정 (가로세로 A4, UTF-8 인코딩)
+    pdf = FPDF('P', 'mm', 'A4')
+    pdf.add_page()
+    pdf.set_auto_page_break(auto=True, margin=20)
+    pdf.set_left_margin(15)
+
+    # 폰트 등록
+    try:
+        registered = register_pdf_fonts(pdf, "NanumGothic")
+    except Exception as e:
+        raise RuntimeError(f"폰트 로드 실패: {str(e)}") from e
+    if not registered:
+        raise RuntimeError("폰트 로드 실패: custom_fonts/ 에 한글 폰트가 없습니다.")
+
+    # 텍스트 렌더링 함수 (글자 잘림 방지)
+    def render_text(text, style="", size=11, is_bold=False):
+        text = text.replace("**", "").replace("##", "").strip()
+        if not text: 
+            pdf.ln(8)
+            return
+            
+        pdf.set_font("NanumGothic", "B" if is_bold else style, size)
+        
+        # 효율적인 줄바꿈 처리 (한글 최적화)
+        char_width = pdf.get_string_width("가")  # 한글 문자 너비 기준
+        max_chars = int((pdf.w - 2*pdf.l_margin) / char_width) - 3
+        
+        lines = []
+        current_line = ""
+        for word in text.split():
+            if pdf.get_string_width(current_line + word) < (pdf.w - 2*pdf.l_margin - 10):
+                current_line += word + " "
+            else:
+                lines.append(current_line)
+                current_line = word + " "
+        lines.append(current_line)
+        
+        for line in lines:
+            pdf.cell(0, 10, line.strip(), ln=True)
+        pdf.ln(5)
+
+    # 본문 처리
+    report_lines = report_text.split('\n')
+    for index, line in enumerate(report_lines):
+        line = line.strip()
+        if job is not None:
+            job.update(progress=index / len(report_lines), message=f"PDF 레이아웃 중... ({index + 1}/{len(report_lines)})")
+        
+        # 1. 제목 처리 (#, ##)
+        if line.startswith("#"):
+            level = line.count("#")
+            title = line.replace("#", "").strip()
+            render_text(title, size=14-level*2, is_bold=True)
+            
+        # 2. 리스트 항목 (1., 2. 등)
+        elif re.match(r'^\d+\.', line):
+            pdf.set_font("NanumGothic", "B", 11)
+            num_part = re.match(r'^\d+\.', line).group()
+            pdf.cell(10, 10, num_part, ln=False)
+            
+            content = line[len(num_part):]
+            render_text(content, is_bold=True)
+            
+        # 3. 일반 텍스트
+        else:
+            render_text(line)
+
+    return pdf_bytes(pdf)
+
+def run_all_markets():
+    st.title("전체 시장 수출실적 예측 비교")
+    st.markdown("""
+현대·기아의 **8개 시장 예측**을 한 화면에서 비교합니다.
+예측은 모델 파일별로 미리 계산된 테이블을 사용하며, 모델이 바뀐 경우에만 여러 코어에서 다시 계산합니다.
+""")
+    table = load_all_forecasts()
+    st.plotly_chart(plot_all_markets(table), use_container_width=True)
+
+    st.markdown(f"#### 시장별 향후 {FORECAST_PERIODS}개월 예측 합계")
+    st.dataframe(
+        forecast_totals(table).style.format("{:,.0f}").background_gradient(cmap="Blues", subset=["합계"]),
+        use_container_width=True
+    )
+
 def fetch_news(query, display=5):
-    headers = {
-        "X-Naver-Client-Id": st.secrets["X-Naver-Client-Id"],
-        "X-Naver-Client-Secret": st.secrets["X-Naver-Client-Secret"],
-    }
-    params = {"query": query, "display": display, "sort": "date"}
-    url = "https://openapi.naver.com/v1/search/news.json"
-    response = requests.get(url, headers=headers, params=params)
-    if response.status_code == 200:
-        return response.json().get("items", [])
-    else:
-        return []
+    # 공용 뉴스 클라이언트 사용 (연결 재사용, 검색어별 캐시, 타임아웃)
+    news = search_news(query, display=display)
+    return news.get("items", []) if news else []
 
 def run_prediction_region():
-    CURRENT_DIR = os.path.dirname(__file__)
-    MODEL_DIR = os.path.join(CURRENT_DIR,"..", "models")
-    CSV_PATH_MAP = {
-        "현대": os.path.join(CURRENT_DIR,"..",  "data", "현대_시장구분별_수출실적.csv"),
-        "기아": os.path.join(CURRENT_DIR,"..", "data", "기아_시장구분별_수출실적.csv")
+    TABLE_MAP = {
+        "현대": "현대_시장구분별_수출실적",
+        "기아": "기아_시장구분별_수출실적"
     }
 
     channel = option_menu(None, ["현대", "기아"], default_index=0, orientation="horizontal",
@@ -106,11 +218,12 @@ def run_prediction_region():
                 "nav-link": {"font-size": "16px", "text-align": "center", "margin": "0px", "padding": "10px"},
                 "nav-link-selected": {"background-color": "#2E86C1", "color": "white"}})
 
-    market_label_map = {
-        "미국": "북미-미국", "캐나다": "북미-캐나다", "멕시코": "북미-멕시코",
-        "동유럽": "동유럽", "서유럽": "서유럽", "아시아": "아시아",
-        "중남미": "중남미", "중동·아프리카": "중동·아프리카"
-    }
+    view_mode = st.radio("보기 방식", ["시장별 상세", "전체 시장 비교"], horizontal=True)
+    if view_mode == "전체 시장 비교":
+        run_all_markets()
+        return
+
+    market_label_map = MARKET_LABEL_MAP
     selected_label = st.selectbox("국가를 선택하세요", list(market_label_map.keys()))
     selected_market = market_label_map[selected_label]
 
@@ -123,16 +236,17 @@ def run_prediction_region():
 """)
 
     if selected_market:
-        model = load_model(channel, selected_market, MODEL_DIR)
-        if model is None:
+        # 오프라인으로 미리 계산한 예측 테이블 사용 (모델 파일이 바뀌면 다시 계산)
+        forecast = load_forecast(channel, selected_market)
+        if forecast is None:
+            st.error(f"❌ 해당 모델 파일이 존재하지 않습니다: {os.path.basename(model_path(channel, selected_market))}")
             return
-        forecast = create_forecast(model)
-        df_actual = load_sales_data(CSV_PATH_MAP[channel], selected_market)
+        df_actual = load_sales_data(TABLE_MAP[channel], selected_market)
         st.plotly_chart(plot_forecast(df_actual, forecast, selected_market), use_container_width=True)
 
         # 뉴스 섹션 추가
         st.subheader(f"[{selected_label}] 관련 최신 뉴스")
-        query = f"{selected_label} 자동차 수출"
+        query = market_news_query(selected_label)
         news_items = fetch_news(query)
         if news_items:
             cols = st.columns(len(news_items))
@@ -204,7 +318,7 @@ def run_prediction_region():
             forecast_end = forecast_selected["예측치"].iloc[-1]
             forecast_trend = "증가세" if forecast_end > forecast_start else "감소세"
 
-            news_items = fetch_news(f"{selected_label} 자동차 수출")
+            news_items = fetch_news(market_news_query(selected_label))
             news_keywords = ", ".join([n["title"].replace("<b>", "").replace("</b>", "") for n in news_items[:3]])
 
             recent_actual = df_actual.sort_values("ds").tail(12)
@@ -245,21 +359,29 @@ def run_prediction_region():
 보고서는 **전문적이지만 이해하기 쉽게**, **한글로** 작성해주세요.
 """
             try:
+                cached_report = read_cached_report(prompt)
                 if TEST_MODE:
                     st.session_state.report_text = "🧪 [테스트 모드] 실제 보고서 대신 이 문구가 출력됩니다.\nPDF 저장 및 레이아웃 확인용입니다."
+                elif cached_report:
+                    # 같은 조건(브랜드·시장·분기·예측치·뉴스)으로 만든 보고서가 있으면 재사용
+                    st.session_state.report_text = cached_report
                 else:
-                    with st.spinner("GPT-4 Turbo가 분석 중입니다..."):
-                        response = client.chat.completions.create(
-                            model="gpt-4-0125-preview",
-                            messages=[
-                                {"role": "system", "content": "당신은 자동차 수출 시장 전문 보고서를 작성하는 전문가입니다."},
-                                {"role": "user", "content": prompt}
-                            ]
-                        )
-                        st.session_state.report_text = response.choices[0].message.content.strip()
+                    # 스크립트 스레드를 막지 않도록 백그라운드 작업으로 생성 (완성된 보고서는 디스크에 캐시)
+                    submit_job("ai_report", generate_report, prompt, client=get_openai_client(),
+                               label="GPT-4 Turbo가 분석 중입니다...")
+                st.session_state.report_pdf = None
             except Exception as e:
                 st.error(f"AI 분석 중 오류 발생: {e}")
 
+        # 진행 중인 보고서는 받은 내용까지 표시하고, 끝나면 결과를 가져옴
+        report_job = render_job_progress("ai_report", show_partial=True)
+        if report_job is not None and report_job.done:
+            if report_job.error:
+                st.error(f"AI 분석 중 오류 발생: {report_job.error}")
+            else:
+                st.session_state.report_text = report_job.result
+            clear_job("ai_report")
+
         # 세션 상태에 보고서가 있다면 출력 및 PDF 저장 가능하도록
         if st.session_state.get("report_text"):
             from markdown import markdown
@@ -284,94 +406,25 @@ def run_prediction_region():
             st.markdown("---")
             st.markdown("#### 📀 보고서를 PDF로 저장하기")
             
-            def generate_pdf():
-                import shutil
-
-                # PDF 설정 (가로세로 A4, UTF-8 인코딩)
-                pdf = FPDF('P', 'mm', 'A4')
-                pdf.add_page()
-                pdf.set_auto_page_break(auto=True, margin=20)
-                pdf.set_left_margin(15)
-                
-                # 폰트 경로 설정
-                FONT_DIR = "custom_fonts"
-                FONT_REGULAR = os.path.join(FONT_DIR, "NanumGothic.ttf")
-                FONT_BOLD = os.path.join(FONT_DIR, "NanumGothicBold.ttf")
-                
-                # 임시 폰트 처리
-                try:
-                    temp_dir = tempfile.gettempdir()
-                    temp_files = []
-                    for font_src, font_name in [(FONT_REGULAR, "NanumGothic.ttf"), 
-                                            (FONT_BOLD, "NanumGothicBold.ttf")]:
-                        temp_path = os.path.join(temp_dir, font_name)
-                        if os.path.exists(temp_path): os.remove(temp_path)
-                        shutil.copy(font_src, temp_path)
-                        temp_files.append(temp_path)
-                        
-                    # 폰트 등록
-                    pdf.add_font("NanumGothic", "", temp_files[0], uni=True)
-                    pdf.add_font("NanumGothic", "B", temp_files[1], uni=True)
-                except Exception as e:
-                    st.error(f"폰트 로드 실패: {str(e)}")
-                    return None
-
-                # 텍스트 렌더링 함수 (글자 잘림 방지)
-                def render_text(text, style="", size=11, is_bold=False):
-                    text = text.replace("**", "").replace("##", "").strip()
-                    if not text: 
-                        pdf.ln(8)
-                        return
-                        
-                    pdf.set_font("NanumGothic", "B" if is_bold else style, size)
-                    
-                    # 효율적인 줄바꿈 처리 (한글 최적화)
-                    char_width = pdf.get_string_width("가")  # 한글 문자 너비 기준
-                    max_chars = int((pdf.w - 2*pdf.l_margin) / char_width) - 3
-                    
-                    lines = []
-                    current_line = ""
-                    for word in text.split():
-                        if pdf.get_string_width(current_line + word) < (pdf.w - 2*pdf.l_margin - 10):
-                            current_line += word + " "
-                        else:
-                            lines.append(current_line)
-                            current_line = word + " "
-                    lines.append(current_line)
-                    
-                    for line in lines:
-                        pdf.cell(0, 10, line.strip(), ln=True)
-                    pdf.ln(5)
-
-                # 본문 처리
-                for line in st.session_state.report_text.split('\n'):
-                    line = line.strip()
-                    
-                    # 1. 제목 처리 (#, ##)
-                    if line.startswith("#"):
-                        level = line.count("#")
-                        title = line.replace("#", "").strip()
-                        render_text(title, size=14-level*2, is_bold=True)
-                        
-                    # 2. 리스트 항목 (1., 2. 등)
-                    elif re.match(r'^\d+\.', line):
-                        pdf.set_font("NanumGothic", "B", 11)
-                        num_part = re.match(r'^\d+\.', line).group()
-                        pdf.cell(10, 10, num_part, ln=False)
-                        
-                        content = line[len(num_part):]
-                        render_text(content, is_bold=True)
-                        
-                    # 3. 일반 텍스트
-                    else:
-                        render_text(line)
-
-                return pdf.output(dest='S').encode('latin-1')
-
-            st.download_button(
-                label="📥 PDF 다운로드",
-                data=generate_pdf(),
-                file_name=f"{selected_label}_시장_분석_보고서.pdf",
-                mime="application/pdf",
-                key="pdf_download"
-            )
+            if st.button("📄 PDF 만들기"):
+                # 같은 내용으로 만든 PDF 가 있으면 바로 사용하고, 없을 때만 백그라운드에서 생성
+                st.session_state.report_pdf = cached_report_pdf(st.session_state.report_text)
+                if st.session_state.report_pdf is None:
+                    submit_job("report_pdf", get_report_pdf, st.session_state.report_text, label="PDF 생성")
+
+            pdf_job = render_job_progress("report_pdf")
+            if pdf_job is not None and pdf_job.done:
+                if pdf_job.error:
+                    st.error(pdf_job.error)
+                else:
+                    st.session_state.report_pdf = pdf_job.result
+                clear_job("report_pdf")
+
+            if st.session_state.get("report_pdf"):
+                st.download_button(
+                    label="📥 PDF 다운로드",
+                    data=st.session_state.report_pdf,
+                    file_name=f"{selected_label}_시장_분석_보고서.pdf",
+                    mime="application/pdf",
+                    key="pdf_download"
+                )
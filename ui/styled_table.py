@@ -0,0 +1,37 @@
+import numpy as np
+import streamlit as st
+from ui.cube import TOTAL
+
+TOTAL_STYLE = 'background-color: #d5f5e3'  # 연한 초록색
+CELL_STYLE = 'text-align: center'
+HEADER_STYLES = [
+    {'selector': 'th', 'props': [('text-align', 'center'), ('background-color', '#f8f9f9')]}
+]
+
+
+def total_mask(pivot):
+    """'총합' 행 또는 '총합' 열에 속하는 셀 (행 × 열 불리언 배열, 한 번의 벡터 연산)"""
+    return np.logical_or.outer(np.asarray(pivot.index == TOTAL), np.asarray(pivot.columns == TOTAL))
+
+
+def _cell_styles(data, mask):
+    # 가운데 정렬도 같은 배열에 넣어 Styler 가 셀 CSS 를 한 번만 해석하도록 함 (set_properties 미사용)
+    return np.where(mask, f'{TOTAL_STYLE}; {CELL_STYLE}', CELL_STYLE)
+
+
+def style_total_table(pivot):
+    """총합 행·열을 강조하고 천 단위 구분 기호를 붙인 Styler"""
+    return (
+        pivot.style.format('{:,}')
+        .apply(_cell_styles, axis=None, mask=total_mask(pivot))
+        .set_table_styles(HEADER_STYLES)
+    )
+
+
+def total_table(pivot, **kwargs):
+    """총합 행·열이 있는 pivot 을 강조 스타일로 표시 (kwargs 는 st.dataframe 으로 전달)
+
+    st.dataframe 이 호출마다 Styler 를 다시 계산하므로 Styler 는 캐시하지 않고 매번 만듭니다.
+    (만드는 비용은 마스크 한 번과 스타일 함수 한 번뿐)
+    """
+    return st.dataframe(style_total_table(pivot), **kwargs)
@@ -1,61 +1,27 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import requests
-import numpy as np
-import platform
-from matplotlib import font_manager, rc
-import io
 import random
 from bs4 import BeautifulSoup
 import plotly.express as px
-from fpdf import FPDF
 from datetime import datetime
 import base64
 import os
-import tempfile
-import shutil
-
-
-
-# 폰트 설정
-plt.rcParams['axes.unicode_minus'] = False
-
-if platform.system() == 'Darwin':
-    rc('font', family='AppleGothic')
-elif platform.system() == 'Windows':
-    path = "c:/Windows/Fonts/malgun.ttf"
-    font_name = font_manager.FontProperties(fname=path).get_name()
-    rc('font', family=font_name)
-else:
-    print('Unknown system... sorry~~~~')
-
-@st.cache_data
-def fontRegistered():
-    font_dirs = [os.getcwd() + '../custom_fonts']
-    font_files = font_manager.findSystemFonts(fontpaths=font_dirs)
-    for font_file in font_files:
-        font_manager.fontManager.addfont(font_file)
-    font_manager._load_fontmanager(try_read_cache=False)
-
-
+from ui.catalog import get_table
+from ui.fonts import register_pdf_fonts, setup_matplotlib_fonts
+from ui.jobs import clear_job, render_job_progress, submit_job
+from ui.news_client import get_news_client, search_news
+from ui.news_queries import continent_mapping, get_news_query
+from ui.trend_batch import export_all
 
 # 데이터 로드 함수
-@st.cache_resource
 def load_data():
-    return pd.read_csv('data/수출 주요 국가 차량 판매량 순위_정리 완료2.csv')
+    return get_table("수출 주요 국가 차량 판매량 순위")
 
-data = load_data()
-
-# 대륙별 국가 매핑
-continent_mapping = {
-    'Asia': ['China', 'India', 'Japan', 'South Korea', 'Thailand'],
-    'Europe': ['Germany', 'France', 'UK', 'Italy', 'Spain'],
-    'Africa': ['South Africa', 'Egypt', 'Nigeria', 'Morocco', 'Algeria'],
-    'North America': ['USA', 'Canada', 'Mexico'],
-    'South America': ['Brazil', 'Argentina', 'Chile', 'Colombia', 'Peru'],
-    'Oceania': ['Australia', 'New Zealand', 'Fiji']
-}
+@st.cache_resource(show_spinner="트렌드 데이터를 불러오는 중...")
+def init_page():
+    """페이지 초기화 (프로세스당 한 번): 폰트 설정, 데이터 로드"""
+    setup_matplotlib_fonts()
+    return load_data()
 
 # HTML 태그 제거 함수
 def clean_html(text):
@@ -66,27 +32,15 @@ def clean_html(text):
 
 # 네이버 뉴스 API 함수
 def fetch_news(query):
-    client_id = st.secrets["X-Naver-Client-Id"]
-    client_secret = st.secrets["X-Naver-Client-Secret"]
-    url = "https://openapi.naver.com/v1/search/news.json"
-    
-    headers = {
-        "X-Naver-Client-Id": client_id,
-        "X-Naver-Client-Secret": client_secret
-    }
-    params = {
-        "query": query,
-        "display": 5,
-        "start": 1,
-        "sort": "date"
-    }
-    try:
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        st.error(f"뉴스를 가져오는 중 오류가 발생했습니다: {e}")
+    # secrets 가 없으면 요청하지 않고 안내만 표시 (실제 요청 실패만 오류로 표시)
+    if not get_news_client().has_credentials():
+        st.info("네이버 API secrets 가 설정되지 않아 뉴스를 표시하지 않습니다.")
         return None
+    # 공용 뉴스 클라이언트 사용 (연결 재사용, 검색어별 캐시, 타임아웃)
+    news = search_news(query, display=5, start=1)
+    if news is None:
+        st.error("뉴스를 가져오는 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요.")
+    return news
 
 # 브랜드별 경쟁 전략 매핑
 def get_brand_strategy(target_brand):
@@ -164,47 +118,38 @@ def get_competitive_strategy(target_model):
         ]
     }
 
-# 공통 뉴스 쿼리 생성 함수
-def get_news_query(region, column=None, value=None):
-    if region in continent_mapping:
-        base_query = region + " 자동차 수출 시장"
-    else:
-        for continent, countries in continent_mapping.items():
-            if region in countries:
-                base_query = continent + " 자동차 수출 시장"
-                break
-        else:
-            base_query = region + " 자동차 수출 시장"
-    
-    if column == '파워트레인' and value:
-        return f"{region} {value} 자동차 수출"
-    return base_query
+def create_pdf_report(selected_region, selected_year, selected_column, analysis_data, job=None,
+                      prev_sales=None, model_brands=None):
+    """지역/연도/분석 기준별 분석 리포트 PDF 바이트
+
+    prev_sales(전년도 브랜드별 판매량), model_brands(모델명 -> 브랜드)를 넘기면
+    원본 데이터를 다시 필터링하지 않습니다. (일괄 생성에서 미리 계산한 값을 사용)
+    """
+    from fpdf import FPDF
 
-def create_pdf_report(selected_region, selected_year, selected_column, analysis_data):
     class KoreanPDF(FPDF):
         def __init__(self):
             super().__init__()
             
             
+            # 한글 폰트 등록 (실패하면 기본 폰트 사용)
+            self.title_font = "helvetica"
             try:
-                # 원본 폰트 경로 (Streamlit Cloud 배포 경로)
-                FONT_PATH_ORIG = "/mount/src/manifest-mini/custom_fonts/NanumGothic.ttf"
-                TEMP_FONT_PATH = os.path.join(tempfile.gettempdir(), "NanumGothic.ttf")
-                
-                # 임시 폴더에 폰트 복사 (권한 문제 해결)
-                if os.path.exists(FONT_PATH_ORIG):
-                    shutil.copyfile(FONT_PATH_ORIG, TEMP_FONT_PATH)
-                    
-                    # 폰트 등록
-                    self.add_font("NanumGothic", "", TEMP_FONT_PATH, uni=True)
-                    self.add_font("NanumGothic", "B", TEMP_FONT_PATH, uni=True)
+                if register_pdf_fonts(self, "NanumGothic"):
                     self.title_font = "NanumGothic"
-                    print(f"폰트 로드 성공: {TEMP_FONT_PATH}")
                 else:
-                    print(f"⚠️ 원본 폰트 없음: {FONT_PATH_ORIG}")
+                    print("⚠️ 한글 폰트 없음: custom_fonts/, fonts/")
             except Exception as e:
                 print(f"❌ 폰트 로드 실패: {str(e)}")
 
+        def multi_cell(self, *args, **kwargs):
+            # fpdf2 는 multi_cell 뒤 커서를 오른쪽 끝에 두므로 pyfpdf 처럼 왼쪽 여백으로 되돌림
+            result = super().multi_cell(*args, **kwargs)
+            self.set_x(self.l_margin)
+            return result
+
+    if job is not None:
+        job.update(progress=0.1, message="리포트 레이아웃 중...")
     pdf = KoreanPDF()
     pdf.add_page()
     
@@ -297,12 +242,16 @@ def create_pdf_report(selected_region, selected_year, selected_column, analysis_
         pdf.set_font(pdf.title_font, "", 12)
         for idx, row in top_brands.iterrows():
             # 전년도 데이터 비교 (간단한 예시)
-            prev_year = int(selected_year) - 1
-            prev_data = data[(data['국가명'] == selected_region) & 
-                           (data['연도'] == prev_year) &
-                           (data['브랜드'] == row['브랜드'])]
-            prev_sales = prev_data['판매량'].sum() if not prev_data.empty else 0
-            change = ((row['판매량'] - prev_sales) / prev_sales * 100) if prev_sales > 0 else 100
+            if prev_sales is not None:
+                prev_total = prev_sales.get(row['브랜드'], 0)
+            else:
+                data = load_data()
+                prev_year = int(selected_year) - 1
+                prev_data = data[(data['국가명'] == selected_region) & 
+                               (data['연도'] == prev_year) &
+                               (data['브랜드'] == row['브랜드'])]
+                prev_total = prev_data['판매량'].sum() if not prev_data.empty else 0
+            change = ((row['판매량'] - prev_total) / prev_total * 100) if prev_total > 0 else 100
             
             pdf.cell(col_widths[0], 10, txt=row['브랜드'], border=1)
             pdf.cell(col_widths[1], 10, txt=f"{row['판매량']:,}대", border=1)
@@ -324,9 +273,14 @@ def create_pdf_report(selected_region, selected_year, selected_column, analysis_
         pdf.cell(col_widths[3], 10, txt="브랜드", border=1)
         pdf.ln()
         
+        if model_brands is None:
+            data = load_data()
+            region_year_data = data[(data['국가명'] == selected_region) & (data['연도'] == selected_year)]
+            model_brands = region_year_data.drop_duplicates('모델명').set_index('모델명')['브랜드']
+
         pdf.set_font(pdf.title_font, "", 12)
         for idx, row in top_models.iterrows():
-            brand = region_year_data[region_year_data['모델명'] == row['모델명']]['브랜드'].values[0]
+            brand = model_brands[row['모델명']]
             
             pdf.cell(col_widths[0], 10, txt=row['모델명'], border=1)
             pdf.cell(col_widths[1], 10, txt=f"{row['판매량']:,}대", border=1)
@@ -462,11 +416,13 @@ def create_pdf_report(selected_region, selected_year, selected_column, analysis_
     pdf.cell(0, 10, txt="© 2023 현대기아차 글로벌 전략팀. All Rights Reserved.", ln=1, align='C')
     
     # UTF-8 인코딩으로 출력
+    if job is not None:
+        job.update(progress=0.9, message="PDF 파일 저장 중...")
     try:
-        return pdf.output(dest='S').encode('latin-1')
+        output = pdf.output(dest='S')
+        return output.encode('latin-1') if isinstance(output, str) else bytes(output)
     except Exception as e:
-        st.error(f"PDF 생성 오류: {str(e)}")
-        return None
+        raise RuntimeError(f"PDF 생성 오류: {str(e)}") from e
 
 # 차트 생성 함수
 def create_plotly_chart(data, x_col, y_col, title, color_sequence=None):
@@ -496,6 +452,7 @@ def create_plotly_chart(data, x_col, y_col, title, color_sequence=None):
     return fig
 
 def run_trend():
+    data = init_page()
 
     # --------------------------------------
     # UI 시작
@@ -523,22 +480,55 @@ def run_trend():
         if region_year_data.empty:
             st.warning("리포트를 생성할 데이터가 없습니다. 다른 필터를 선택해 주세요.")
         else:
-            with st.spinner("리포트 생성 중..."):
-                if selected_column == '브랜드':
-                    analysis_data = region_year_data.groupby('브랜드')['판매량'].sum().reset_index()
-                elif selected_column == '모델명':
-                    analysis_data = region_year_data.groupby('모델명')['판매량'].sum().reset_index()
-                elif selected_column == '파워트레인':
-                    analysis_data = region_year_data.groupby('파워트레인')['판매량'].sum().reset_index()
-                
-                pdf = create_pdf_report(selected_region, selected_year, selected_column, analysis_data)
-                
-                
-                
-                b64 = base64.b64encode(pdf).decode()
-                href = f'<a href="data:application/octet-stream;base64,{b64}" download="현대기아차_{selected_region}_수출분석.pdf">📥 리포트 다운로드</a>'
-                st.markdown(href, unsafe_allow_html=True)
-                st.success("리포트 생성이 완료되었습니다. 위 링크를 클릭하여 다운로드하세요.")
+            if selected_column == '브랜드':
+                analysis_data = region_year_data.groupby('브랜드')['판매량'].sum().reset_index()
+            elif selected_column == '모델명':
+                analysis_data = region_year_data.groupby('모델명')['판매량'].sum().reset_index()
+            elif selected_column == '파워트레인':
+                analysis_data = region_year_data.groupby('파워트레인')['판매량'].sum().reset_index()
+
+            # 리포트는 백그라운드에서 생성 (다른 위젯을 조작해도 작업이 유지됨)
+            st.session_state.trend_report = None
+            submit_job("trend_pdf", create_pdf_report, selected_region, selected_year, selected_column, analysis_data,
+                       label="리포트 생성 중...")
+            st.session_state.trend_report_region = selected_region
+
+    report_job = render_job_progress("trend_pdf")
+    if report_job is not None and report_job.done:
+        if report_job.error:
+            st.error(report_job.error)
+        else:
+            st.session_state.trend_report = report_job.result
+        clear_job("trend_pdf")
+
+    if st.session_state.get("trend_report"):
+        b64 = base64.b64encode(st.session_state.trend_report).decode()
+        report_region = st.session_state.get("trend_report_region", selected_region)
+        href = f'<a href="data:application/octet-stream;base64,{b64}" download="현대기아차_{report_region}_수출분석.pdf">📥 리포트 다운로드</a>'
+        st.markdown(href, unsafe_allow_html=True)
+        st.success("리포트 생성이 완료되었습니다. 위 링크를 클릭하여 다운로드하세요.")
+
+    with st.expander("📦 전체 지역·연도 리포트 일괄 생성"):
+        st.caption("모든 지역 × 연도 × 분석 기준(브랜드/모델명/파워트레인) 리포트를 여러 프로세스에서 만들어 zip 파일 하나로 받습니다.")
+        if st.button("📦 일괄 생성 시작"):
+            st.session_state.trend_batch_zip = None
+            submit_job("trend_batch", export_all, label="리포트 일괄 생성")
+
+        batch_job = render_job_progress("trend_batch")
+        if batch_job is not None and batch_job.done:
+            if batch_job.error:
+                st.error(batch_job.error)
+            else:
+                st.session_state.trend_batch_zip = batch_job.result
+            clear_job("trend_batch")
+
+        if st.session_state.get("trend_batch_zip"):
+            st.download_button(
+                label="📥 전체 리포트 다운로드 (zip)",
+                data=st.session_state.trend_batch_zip,
+                file_name=f"현대기아차_수출분석_리포트_{datetime.now():%Y%m%d}.zip",
+                mime="application/zip",
+            )
 
     # 메인 컨텐츠
     st.title(f"{selected_region} 지역 {selected_year}년 {selected_column}별 분석")
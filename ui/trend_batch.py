@@ -0,0 +1,95 @@
+import argparse
+import io
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from ui.catalog import get_table
+
+TREND_TABLE = "수출 주요 국가 차량 판매량 순위"
+REPORT_COLUMNS = ["브랜드", "모델명", "파워트레인"]
+
+
+def report_filename(region, year, column):
+    return f"현대기아차_{region}_{year}_{column}_수출분석.pdf"
+
+
+def build_tasks(df):
+    """전체 국가명×연도×분석 기준 조합의 리포트 입력값을 한 번의 그룹 집계로 계산
+
+    국가명·연도·브랜드·모델명·파워트레인 단위로 한 번만 합계를 낸 뒤,
+    그 작은 표를 다시 묶어 기준별 analysis_data, 전년도 브랜드 판매량, 모델→브랜드 매핑을 만듭니다.
+    """
+    keys = ["국가명", "연도"]
+    base = df.groupby(keys + REPORT_COLUMNS, sort=False)["판매량"].sum().reset_index()
+    totals = {column: base.groupby(keys + [column])["판매량"].sum() for column in REPORT_COLUMNS}
+    model_brands = base.drop_duplicates(keys + ["모델명"]).set_index(keys + ["모델명"])["브랜드"].sort_index()
+
+    tasks = []
+    for (region, year), _ in base.groupby(keys, sort=False):
+        brand_prev = totals["브랜드"].get((region, year - 1))
+        for column in REPORT_COLUMNS:
+            analysis_data = totals[column].loc[(region, year)].reset_index()
+            options = {}
+            if column == "브랜드":
+                options["prev_sales"] = brand_prev.to_dict() if brand_prev is not None else {}
+            elif column == "모델명":
+                options["model_brands"] = model_brands.loc[(region, year)].to_dict()
+            tasks.append((region, year, column, analysis_data, options))
+    return tasks
+
+
+def _render_task(task):
+    """프로세스 풀 작업 단위: 리포트 하나를 만들어 (파일명, PDF 바이트, 오류) 반환"""
+    from ui.trend import create_pdf_report
+
+    region, year, column, analysis_data, options = task
+    filename = report_filename(region, year, column)
+    try:
+        return filename, create_pdf_report(region, year, column, analysis_data, **options), None
+    except Exception as e:
+        return filename, None, str(e)
+
+
+def export_all(max_workers=None, job=None):
+    """전체 조합의 리포트를 여러 프로세스에서 만들어 zip 바이트로 반환
+
+    실패한 리포트는 건너뛰고 zip 안의 errors.txt 에 사유를 남깁니다.
+    """
+    tasks = build_tasks(get_table(TREND_TABLE))
+    if job is not None:
+        job.update(progress=0.0, message=f"리포트 {len(tasks)}개 생성 중...")
+
+    results = []
+    workers = min(len(tasks), max_workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_render_task, task) for task in tasks]
+        for index, future in enumerate(as_completed(futures), 1):
+            results.append(future.result())
+            if job is not None:
+                job.update(progress=index / len(tasks), message=f"리포트 생성 중... ({index}/{len(tasks)})")
+
+    errors = []
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+        for filename, pdf, error in sorted(results):
+            if error is None:
+                zf.writestr(filename, pdf)
+            else:
+                errors.append(f"{filename}: {error}")
+        if errors:
+            zf.writestr("errors.txt", "\n".join(errors))
+    if len(errors) == len(tasks):
+        raise RuntimeError(f"리포트를 하나도 만들지 못했습니다: {errors[0]}")
+    return buffer.getvalue()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="전체 지역×연도×분석 기준 리포트 PDF 일괄 생성")
+    parser.add_argument("--out", default="trend_reports.zip", help="저장할 zip 파일 경로")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 코어 수)")
+    args = parser.parse_args()
+    archive = export_all(max_workers=args.workers)
+    with open(args.out, "wb") as f:
+        f.write(archive)
+    with zipfile.ZipFile(args.out) as zf:
+        print(f"{args.out}: 파일 {len(zf.namelist())}개")
@@ -0,0 +1,169 @@
+import threading
+import pandas as pd
+import streamlit as st
+
+# 현대: 카테고리 = "차체 파워트레인" ('기타' 는 파워트레인 구분 없음)
+# 여러 카테고리에 있는 모델은 마지막 카테고리 기준 (예: Palisade (LX3 HEV))
+HYUNDAI_CATEGORIES = {
+    '세단 내연기관': [
+        'Avante (CN7)', 'Sonata (LF)', 'Sonata (DN8)',
+        'Grandeur (IG)', 'Grandeur (GN7)', 'G70 (IK)',
+        'G80 (RG3)', 'G90 (HI)',  'Verna (Hci)', 'Verna (BN7i)',
+        'Elantra (CN7c)', 'La festa (SQ)', 'Verna (YC)',
+        'Celesta (ID)', 'Mistra (DU2)', 'Elantra (CN7a)',
+        'Sonata (DN8a)', 'Solaris (HCr)', 'Accent (HCv)',
+        'Accent (BN7v)', 'Elantra (CN7v)'
+    ],
+    '세단 하이브리드': [
+        'Avante (CN7 HEV)', 'IONIQ (AE HEV)', 'Sonata (DN8 HEV)',
+        'Grandeur (IG HEV)', 'Grandeur (GN7 HEV)'
+    ],
+    '세단 전기차': [
+        'IONIQ (AE EV)', 'IONIQ 6 (CE)', 'G80 (RG3 EV)'
+    ],
+    'SUV 내연기관': [
+        'Venue (QX)', 'Kona (OS)',  'Kona (SX2)', 'Tucson (TL)',
+        'Tucson (NX4)', 'Santa-Fe (TM)', 'Santa-Fe (MX5)',
+        'Palisade (LX2)', 'GV80 (JX)', 'Exter (AI3 SUV)', 'Venue (QXi)',
+        'Creta (SU2i)', 'Creta(SU2i)', 'Bayon (BC3 CUV)',
+        'Mufasa (NU2)', 'Tucson (NX4c)', 'ix35 (NU)',
+        'Santa Fe (MX5c)', 'Santa Fe (TMc)', 'Tucson (NX4a)',
+        'Tucson OB (NX4a OB)', 'Santa-Fe (TMa)', 'GV70 (JKa)',
+        'Tucson (TLe)', 'Tucson (NX4e)',  'Creta (SU2r)',
+        'Creta (GSb)', 'Creta (SU2b)', 'Santa-Fe (TMid)',
+        'Santa-Fe (MX5id)',  'Creta (SU2id)',
+        'Creta (SU2v)', 'Tucson (NX4v)', 'Santa Fe (TMv)',
+        'Santa Fe (MX5v)', 'Palisade (LX3)',
+        'GV80 Coupe (JX Coupe)'
+    ],
+    'SUV 하이브리드': [
+        'Kona (OS HEV)', 'Kona (SX2 HEV)', 'Tucson (NX4 HEV)',
+        'Santa-Fe (TM HEV)', 'Santa-Fe (MX5 HEV)',
+        'Santa Fe HEV (TMa HEV)', 'Tucson HEV (NX4c HEV)',
+        'Santa-Fe HEV (MX5a HEV)',  'Tucson HEV (NX4e HEV)',
+        'Santa Fe HEV (TMv HEV)', 'Santa-Fe (MX5id HEV)'
+    ],
+    'SUV 전기차': [
+        'Kona (OS EV)', 'Kona (OS N)', 'Kona (SX2 EV)', 'NEXO (FE)',
+        'IONIQ 5 (NE)', 'IONIQ 5 N (NE N)', 'Kona N (OS N)',
+        'Tucson (NX4 PHEV)', 'Santa-Fe (TM PHEV)',
+        'Santa-Fe (MX5 PHEV)', 'GV70 EV (JK EV)',
+        'Kona EV (OSi EV)', 'IONIQ5 (NEi)', 'Tucson (NX4i)',
+        'Exter(AI3 SUV)', 'Venue(QXi)', 'Creta(SU2i)',
+        'Creta(SU2i LWB)', 'Tucson OB (NX4a OB)',  'Ioniq5 (NEa)',
+        'Kona EV (OSe EV)', 'Kona EV (SX2e EV)',
+        'Tucson PHEV (NX4e PHEV)',  'Kona EV (SX2id EV)',
+        'IONIQ5 (NE)', 'IONIQ5 (NEid N)', 'GV70 (JKa)',
+        'GV70 EV (Jka EV)', 'IONIQ5 (NEv)', 'GV60 (JW)',
+        'Palisade (LX3 HEV)', 'Palisade (LX2v)', 'Santa Fe (TMv)'
+    ],
+    '기타': [
+        'Veloster (JS N)', 'G70 S/B (IK S/B)', 'Casper (AX)', 'LCV',
+        'HCV', 'i30 (PD)', 'Grand i10 (AI3 5DR)', 'i20 (BI3 5DR)',
+        'i10 (AC3)', 'i20 (BC3)', 'i20 N (BC3 N)', 'Custo (KU)',
+        'BHMC', 'i30 (PDe)', 'i30 (Pde N)', 'HB20 (BR2)',
+        'Stargazer (KS)', 'HTBC', 'NX4m', 'HCm', 'Others', 'CV',
+        'i10(AI3v 4DR)', 'i10(AI3v 5DR)', 'Kusto (KUv)', 'Porter (HRv)',
+        'Mighty (LTv)', 'Mighty (VTv)', 'Mighty (QTv)',
+        'Mighty (QTc)', 'Truck',  'IONIQ5 Robotaxi (NE R)',
+        'PV', 'G90', 'Casper (AX EV)', 'Casper EV (AX EV)',
+        'IONIQ New Car (ME)', 'Palisade (LX3 HEV)', 'Santa Fe (TMv)', 'Santa Fe (MX5v)'
+    ]
+}
+
+# 기아: 카테고리 = 차체
+KIA_CATEGORIES = {
+    '세단': ['Morning', 'Ray', 'K3', 'K5', 'Stinger', 'K7 / K8', 'K9', "Morning / Picanto", "K5 / Optima", 'K7 / K8 / Cadenza'],
+    'SUV': ['Seltos', 'Niro', 'Sportage', 'Sorento', 'Mohave', 'EV6', 'EV9', "Mohave / Borrego"],
+    '기타': ['Bongo', 'Carnival', 'Bus', "Carnival / Sedona", "Millitary", "Bongo (특수)", "Bus (특수)"]
+}
+
+# 기아 파워트레인: 모델명에 포함된 문자열로 판단 (위에서부터 처음 일치하는 유형)
+KIA_POWERTRAIN_RULES = {
+    '내연기관': ['Bongo', 'K3', 'K5', 'Carnival', 'Seltos', 'Sportage', 'Sorento'],
+    '전기차': ['EV6', 'EV9', 'Niro EV', 'Soul EV', 'EV5'],
+    '하이브리드': ['Niro', 'Sorento Hybrid', 'Sportage Hybrid']
+}
+DEFAULT_POWERTRAIN = '내연기관'
+
+FIELDS = ['카테고리', '차체', '파워트레인']
+BODY_TYPES = ['세단', 'SUV', '기타']
+POWERTRAINS = ['내연기관', '하이브리드', '전기차']
+
+
+def kia_powertrain(model):
+    """기아 모델명 → 파워트레인 (규칙에 없으면 None)"""
+    for ptype, keywords in KIA_POWERTRAIN_RULES.items():
+        if any(keyword in model for keyword in keywords):
+            return ptype
+    return None
+
+
+class VehicleTaxonomy:
+    """브랜드별 모델 → (카테고리, 차체, 파워트레인) 코드 표
+
+    목록에 있는 모델은 처음 만들 때 한 번에 표로 만들고, 데이터에 새로 나온 모델은
+    처음 조회될 때 한 번만 규칙을 적용해 표에 추가합니다. (이후에는 map 조회만 수행)
+    분류 규칙에 없는 모델은 처음 한 번만 로그로 남깁니다.
+    """
+
+    def __init__(self, brand):
+        self.brand = brand
+        self.categories = HYUNDAI_CATEGORIES if brand == "현대" else KIA_CATEGORIES
+        self.unknown = set()
+        self._lock = threading.Lock()
+        self._rows = {}
+        for category, models in self.categories.items():
+            for model in models:
+                self._rows[model] = self._classify(model, category)
+        self.table = self._to_table()
+
+    def _classify(self, model, category=None):
+        if self.brand == "현대":
+            body, _, powertrain = category.partition(' ')
+            return category, body, powertrain or None
+        return category, category, kia_powertrain(model) or DEFAULT_POWERTRAIN
+
+    def _to_table(self):
+        table = pd.DataFrame.from_dict(self._rows, orient='index', columns=FIELDS)
+        table['카테고리'] = pd.Categorical(table['카테고리'], categories=list(self.categories))
+        table['차체'] = pd.Categorical(table['차체'], categories=BODY_TYPES)
+        table['파워트레인'] = pd.Categorical(table['파워트레인'], categories=POWERTRAINS)
+        return table
+
+    def _compile(self, models):
+        """표에 없는 모델을 한 번만 분류해 추가 (목록 밖 모델은 기아 파워트레인 규칙만 적용)"""
+        with self._lock:
+            new = [model for model in models if model not in self._rows and model not in self.unknown]
+            if not new:
+                return
+            unmatched = []
+            for model in new:
+                if self.brand == "기아":
+                    self._rows[model] = self._classify(model)
+                    if kia_powertrain(model) is not None:
+                        continue
+                unmatched.append(model)
+            self.unknown.update(unmatched)
+            self.table = self._to_table()
+        if unmatched:
+            print(f"[taxonomy] {self.brand}: 분류 규칙에 없는 모델 {len(unmatched)}개 - {', '.join(map(str, unmatched))}")
+
+    def lookup(self, models, field):
+        """모델 컬럼(Series)에 대응하는 field 값 (분류할 수 없으면 NaN)
+
+        고유 모델만 분류한 뒤 map 으로 펼치므로 행 수가 늘어나도 규칙을 다시 적용하지 않습니다.
+        """
+        self._compile(models.dropna().unique())
+        return models.map(self.table[field].astype(object))
+
+    def get(self, model, field):
+        """모델 하나의 field 값 (없으면 None)"""
+        self._compile([model])
+        value = self.table[field].get(model)
+        return None if pd.isna(value) else value
+
+
+@st.cache_resource(show_spinner=False)
+def get_taxonomy(brand):
+    return VehicleTaxonomy(brand)